@@ -1,5 +1,4 @@
 import asyncio
-from pprint import pprint
 
 from can import Bus, Message
 from uds.transport_interface import PyCanTransportInterface
@@ -31,13 +30,13 @@ async def main():
     # receive CAN packet 1
     kvaser_interface_2.send(frame_1)  # transmit CAN Frame 1
     record_1 = await can_ti.async_receive_packet(timeout=1000)   # receive CAN packet 1 carried by frame 1
-    pprint(record_1.__dict__)  # show attributes of CAN packet record 1
+    print(record_1)  # show attributes of CAN packet record 1
 
     # receive CAN packet 2
     kvaser_interface_2.send(frame_2)  # transmit CAN Frame 2
     kvaser_interface_2.send(frame_3)  # transmit CAN Frame 3
     record_2 = await can_ti.async_receive_packet(timeout=1000)
-    pprint(record_2.__dict__)  # show attributes of CAN packet record 2
+    print(record_2)  # show attributes of CAN packet record 2
 
     # close connections with CAN interfaces
     del can_ti
@@ -1,4 +1,3 @@
-from pprint import pprint
 from time import sleep
 
 from can import Bus
@@ -35,11 +34,11 @@ def main():
 
     # send CAN Packet 1
     record_1 = can_ti.send_packet(packet_1)
-    pprint(record_1.__dict__)
+    print(record_1)
 
     # send CAN Packet 2
     record_2 = can_ti.send_packet(packet_2)
-    pprint(record_2.__dict__)
+    print(record_2)
 
     # close connections with CAN interfaces
     del can_ti
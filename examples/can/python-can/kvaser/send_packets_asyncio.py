@@ -1,5 +1,4 @@
 import asyncio
-from pprint import pprint
 
 from can import Bus
 from uds.transport_interface import PyCanTransportInterface
@@ -35,11 +34,11 @@ async def main():
 
     # send CAN Packet 1
     record_1 = await can_ti.async_send_packet(packet_1)
-    pprint(record_1.__dict__)
+    print(record_1)
 
     # send CAN Packet 2
     record_2 = await can_ti.async_send_packet(packet_2)
-    pprint(record_2.__dict__)
+    print(record_2)
 
     # close connections with CAN interfaces
     del can_ti
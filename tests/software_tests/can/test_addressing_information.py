@@ -194,6 +194,7 @@ class TestCanAddressingInformation:
         (0x5B, 0x9E),
     ])
     def test_encode_ai_data_bytes__normal(self, addressing_format, target_address, address_extension):
+        self.mock_validate_addressing_format.return_value = addressing_format
         assert CanAddressingInformation.encode_ai_data_bytes(addressing_format=addressing_format,
                                                              address_extension=address_extension,
                                                              target_address=target_address) == []
@@ -205,6 +206,7 @@ class TestCanAddressingInformation:
         (0x5B, 0x9E),
     ])
     def test_encode_ai_data_bytes__extended(self, target_address, address_extension):
+        self.mock_validate_addressing_format.return_value = CanAddressingFormat.EXTENDED_ADDRESSING
         assert CanAddressingInformation.encode_ai_data_bytes(
             addressing_format=CanAddressingFormat.EXTENDED_ADDRESSING,
             address_extension=address_extension,
@@ -219,6 +221,7 @@ class TestCanAddressingInformation:
         (0x5B, 0x9E),
     ])
     def test_encode_ai_data_bytes__mixed(self, addressing_format, target_address, address_extension):
+        self.mock_validate_addressing_format.return_value = addressing_format
         assert CanAddressingInformation.encode_ai_data_bytes(
             addressing_format=addressing_format,
             address_extension=address_extension,
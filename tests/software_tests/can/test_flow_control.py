@@ -417,11 +417,12 @@ class TestCanFlowControlHandler:
         mock_is_flow_control.return_value = True
         self.mock_get_ai_data_bytes_number.return_value = ai_bytes_number
         assert CanFlowControlHandler.decode_flow_status(addressing_format=addressing_format,
-                                                        raw_frame_data=raw_frame_data) == mock_can_flow_status_class.return_value
+                                                        raw_frame_data=raw_frame_data) \
+               == mock_can_flow_status_class.validate_member.return_value
         mock_is_flow_control.assert_called_once_with(addressing_format=addressing_format,
                                                      raw_frame_data=raw_frame_data)
         self.mock_get_ai_data_bytes_number.assert_called_once_with(addressing_format)
-        mock_can_flow_status_class.assert_called_once_with(raw_frame_data[ai_bytes_number] & 0xF)
+        mock_can_flow_status_class.validate_member.assert_called_once_with(raw_frame_data[ai_bytes_number] & 0xF)
 
     @pytest.mark.parametrize("addressing_format", ["some addressing format", "another format"])
     @pytest.mark.parametrize("raw_frame_data", [
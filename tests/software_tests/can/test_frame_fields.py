@@ -162,6 +162,7 @@ class TestCanIdHandler:
     ])
     def test_generate_normal_fixed_addressed_can_id__valid(self, addressing_type, target_address, source_address,
                                                            expected_can_id):
+        self.mock_validate_addressing_type.return_value = addressing_type
         assert CanIdHandler.encode_normal_fixed_addressed_can_id(addressing_type=addressing_type,
                                                                  target_address=target_address,
                                                                  source_address=source_address) == expected_can_id
@@ -188,6 +189,7 @@ class TestCanIdHandler:
     ])
     def test_generate_mixed_addressed_29bit_can_id__valid(self, addressing_type, target_address, source_address,
                                                           expected_can_id):
+        self.mock_validate_addressing_type.return_value = addressing_type
         assert CanIdHandler.encode_mixed_addressed_29bit_can_id(addressing_type=addressing_type,
                                                                 target_address=target_address,
                                                                 source_address=source_address) == expected_can_id
@@ -516,6 +518,14 @@ class TestCanDlcHandler:
     @patch(f"{SCRIPT_LOCATION}.CanDlcHandler.validate_dlc")
     def test_decode(self, mock_validate_dlc, dlc, data_bytes_number):
         assert CanDlcHandler.decode_dlc(dlc) == data_bytes_number
+        mock_validate_dlc.assert_not_called()
+
+    @pytest.mark.parametrize("dlc", [None, 8., "8", -1, 16])
+    @patch(f"{SCRIPT_LOCATION}.CanDlcHandler.validate_dlc")
+    def test_decode__invalid(self, mock_validate_dlc, dlc):
+        mock_validate_dlc.side_effect = ValueError
+        with pytest.raises(ValueError):
+            CanDlcHandler.decode_dlc(dlc)
         mock_validate_dlc.assert_called_once_with(dlc)
 
     # encode_dlc
@@ -534,6 +544,14 @@ class TestCanDlcHandler:
     @patch(f"{SCRIPT_LOCATION}.CanDlcHandler.validate_data_bytes_number")
     def test_encode(self, mock_validate_data_bytes_number, dlc, data_bytes_number):
         assert CanDlcHandler.encode_dlc(data_bytes_number) == dlc
+        mock_validate_data_bytes_number.assert_not_called()
+
+    @pytest.mark.parametrize("data_bytes_number", [None, 8., "8", -1, 9, 65])
+    @patch(f"{SCRIPT_LOCATION}.CanDlcHandler.validate_data_bytes_number")
+    def test_encode__invalid(self, mock_validate_data_bytes_number, data_bytes_number):
+        mock_validate_data_bytes_number.side_effect = ValueError
+        with pytest.raises(ValueError):
+            CanDlcHandler.encode_dlc(data_bytes_number)
         mock_validate_data_bytes_number.assert_called_once_with(data_bytes_number, True)
 
     # get_min_dlc
@@ -664,6 +682,20 @@ class TestCanIdHandlerIntegration:
             CanIdHandler.SOURCE_ADDRESS_NAME: source_address
         }
 
+    def test_encode_can_id__addressing_type_value(self, example_addressing_type):
+        assert CanIdHandler.encode_normal_fixed_addressed_can_id(addressing_type=example_addressing_type.value,
+                                                                 target_address=0x12,
+                                                                 source_address=0xF1) \
+               == CanIdHandler.encode_normal_fixed_addressed_can_id(addressing_type=example_addressing_type,
+                                                                    target_address=0x12,
+                                                                    source_address=0xF1)
+        assert CanIdHandler.encode_mixed_addressed_29bit_can_id(addressing_type=example_addressing_type.value,
+                                                                target_address=0x12,
+                                                                source_address=0xF1) \
+               == CanIdHandler.encode_mixed_addressed_29bit_can_id(addressing_type=example_addressing_type,
+                                                                   target_address=0x12,
+                                                                   source_address=0xF1)
+
 
 @pytest.mark.integration
 class TestCanDlcHandlerIntegration:
@@ -1,5 +1,5 @@
 import pytest
-from mock import Mock, patch, call
+from mock import Mock, patch
 
 from uds.can.mixed_addressing_information import Mixed11BitCanAddressingInformation, Mixed29BitCanAddressingInformation, \
     CanAddressingFormat, InconsistentArgumentsError, UnusedArgumentError, AbstractCanAddressingInformation
@@ -71,7 +71,7 @@ class TestMixed11BitCanAddressingInformation:
                                                                      can_id=can_id,
                                                                      address_extension=address_extension) == {
             AbstractCanAddressingInformation.ADDRESSING_FORMAT_NAME: CanAddressingFormat.MIXED_11BIT_ADDRESSING,
-            AbstractCanAddressingInformation.ADDRESSING_TYPE_NAME: addressing_type,
+            AbstractCanAddressingInformation.ADDRESSING_TYPE_NAME: self.mock_validate_addressing_type.return_value,
             AbstractCanAddressingInformation.CAN_ID_NAME: can_id,
             AbstractCanAddressingInformation.ADDRESS_EXTENSION_NAME: address_extension,
             AbstractCanAddressingInformation.TARGET_ADDRESS_NAME: None,
@@ -172,8 +172,7 @@ class TestMixed29BitCanAddressingInformation:
             AbstractCanAddressingInformation.ADDRESS_EXTENSION_NAME: address_extension,
         }
         self.mock_validate_addressing_type.assert_called_once_with(addressing_type)
-        self.mock_validate_raw_byte.assert_has_calls([call(target_address), call(source_address),
-                                                      call(address_extension)], any_order=True)
+        self.mock_validate_raw_byte.assert_called_once_with(address_extension)
         self.mock_can_id_handler_class.validate_can_id.assert_not_called()
         self.mock_can_id_handler_class.decode_mixed_addressed_29bit_can_id.assert_not_called()
         self.mock_can_id_handler_class.encode_mixed_addressed_29bit_can_id.assert_called_once_with(
@@ -1,5 +1,5 @@
 import pytest
-from mock import Mock, patch, call
+from mock import Mock, patch
 
 from uds.can.normal_addressing_information import Normal11BitCanAddressingInformation, NormalFixedCanAddressingInformation, \
     CanAddressingFormat, InconsistentArgumentsError, UnusedArgumentError, AbstractCanAddressingInformation
@@ -14,15 +14,12 @@ class TestNormal11BitCanAddressingInformation:
     def setup_method(self):
         self.mock_addressing_information = Mock(spec=Normal11BitCanAddressingInformation)
         # patching
-        self._patcher_validate_raw_byte = patch(f"{SCRIPT_LOCATION}.validate_raw_byte")
-        self.mock_validate_raw_byte = self._patcher_validate_raw_byte.start()
         self._patcher_validate_addressing_type = patch(f"{SCRIPT_LOCATION}.AddressingType.validate_member")
         self.mock_validate_addressing_type = self._patcher_validate_addressing_type.start()
         self._patcher_can_id_handler_class = patch(f"{SCRIPT_LOCATION}.CanIdHandler")
         self.mock_can_id_handler_class = self._patcher_can_id_handler_class.start()
 
     def teardown_method(self):
-        self._patcher_validate_raw_byte.stop()
         self._patcher_validate_addressing_type.stop()
         self._patcher_can_id_handler_class.stop()
 
@@ -83,15 +80,12 @@ class TestNormalFixedCanAddressingInformation:
     def setup_method(self):
         self.mock_addressing_information = Mock(spec=NormalFixedCanAddressingInformation)
         # patching
-        self._patcher_validate_raw_byte = patch(f"{SCRIPT_LOCATION}.validate_raw_byte")
-        self.mock_validate_raw_byte = self._patcher_validate_raw_byte.start()
         self._patcher_validate_addressing_type = patch(f"{SCRIPT_LOCATION}.AddressingType.validate_member")
         self.mock_validate_addressing_type = self._patcher_validate_addressing_type.start()
         self._patcher_can_id_handler_class = patch(f"{SCRIPT_LOCATION}.CanIdHandler")
         self.mock_can_id_handler_class = self._patcher_can_id_handler_class.start()
 
     def teardown_method(self):
-        self._patcher_validate_raw_byte.stop()
         self._patcher_validate_addressing_type.stop()
         self._patcher_can_id_handler_class.stop()
 
@@ -167,7 +161,6 @@ class TestNormalFixedCanAddressingInformation:
             AbstractCanAddressingInformation.ADDRESS_EXTENSION_NAME: None,
         }
         self.mock_validate_addressing_type.assert_called_once_with(addressing_type)
-        self.mock_validate_raw_byte.assert_has_calls([call(target_address), call(source_address)], any_order=True)
         self.mock_can_id_handler_class.validate_can_id.assert_not_called()
         self.mock_can_id_handler_class.decode_normal_fixed_addressed_can_id.assert_not_called()
         self.mock_can_id_handler_class.encode_normal_fixed_addressed_can_id.assert_called_once_with(
@@ -204,5 +197,4 @@ class TestNormalFixedCanAddressingInformation:
             AbstractCanAddressingInformation.ADDRESS_EXTENSION_NAME: None,
         }
         self.mock_validate_addressing_type.assert_called_once_with(addressing_type)
-        self.mock_validate_raw_byte.assert_not_called()
         self.mock_can_id_handler_class.decode_normal_fixed_addressed_can_id.assert_called_once_with(can_id)
@@ -624,35 +624,35 @@ class TestCanSingleFrameHandler:
     @pytest.mark.parametrize("dlc", [CanSingleFrameHandler.MAX_DLC_VALUE_SHORT_SF_DL,
                                      CanSingleFrameHandler.MAX_DLC_VALUE_SHORT_SF_DL - 1])
     @pytest.mark.parametrize("addressing_format", [None, "some addressing format"])
-    @patch(f"{SCRIPT_LOCATION}.CanSingleFrameHandler._CanSingleFrameHandler__encode_any_sf_dl")
     @patch(f"{SCRIPT_LOCATION}.CanSingleFrameHandler.validate_sf_dl")
-    def test_encode_valid_sf_dl__short(self, mock_validate_sf_dl, mock_encode_any_sf_dl,
+    def test_encode_valid_sf_dl__short(self, mock_validate_sf_dl,
                                  sf_dl, dlc, addressing_format):
         assert CanSingleFrameHandler._CanSingleFrameHandler__encode_valid_sf_dl(
             sf_dl=sf_dl,
             addressing_format=addressing_format,
-            dlc=dlc) == mock_encode_any_sf_dl.return_value
+            dlc=dlc) == [(CanSingleFrameHandler.SINGLE_FRAME_N_PCI << 4) + sf_dl]
         mock_validate_sf_dl.assert_called_once_with(sf_dl=sf_dl,
                                                     dlc=dlc,
                                                     addressing_format=addressing_format)
-        mock_encode_any_sf_dl.assert_called_once_with(sf_dl_short=sf_dl)
+        self.mock_validate_nibble.assert_not_called()
+        self.mock_validate_raw_byte.assert_not_called()
 
     @pytest.mark.parametrize("sf_dl", [0, 8, 0xF])
     @pytest.mark.parametrize("dlc", [CanSingleFrameHandler.MAX_DLC_VALUE_SHORT_SF_DL + 1,
                                      CanSingleFrameHandler.MAX_DLC_VALUE_SHORT_SF_DL + 2])
     @pytest.mark.parametrize("addressing_format", [None, "some addressing format"])
-    @patch(f"{SCRIPT_LOCATION}.CanSingleFrameHandler._CanSingleFrameHandler__encode_any_sf_dl")
     @patch(f"{SCRIPT_LOCATION}.CanSingleFrameHandler.validate_sf_dl")
-    def test_encode_valid_sf_dl__long(self, mock_validate_sf_dl, mock_encode_any_sf_dl,
+    def test_encode_valid_sf_dl__long(self, mock_validate_sf_dl,
                                 sf_dl, dlc, addressing_format):
         assert CanSingleFrameHandler._CanSingleFrameHandler__encode_valid_sf_dl(
             sf_dl=sf_dl,
             addressing_format=addressing_format,
-            dlc=dlc) == mock_encode_any_sf_dl.return_value
+            dlc=dlc) == [CanSingleFrameHandler.SINGLE_FRAME_N_PCI << 4, sf_dl]
         mock_validate_sf_dl.assert_called_once_with(sf_dl=sf_dl,
                                                     dlc=dlc,
                                                     addressing_format=addressing_format)
-        mock_encode_any_sf_dl.assert_called_once_with(sf_dl_long=sf_dl)
+        self.mock_validate_nibble.assert_not_called()
+        self.mock_validate_raw_byte.assert_not_called()
 
     # __encode_any_sf_dl
 
@@ -12,7 +12,7 @@ from uds.segmentation import CanSegmenter
 
 
 @fixture(params=[(0x00, 0xFF, 0xAA, 0x55), [0x00], (0xFF, ), [0x12, 0xFF, 0xE0, 0x1D, 0xC2, 0x3B, 0x00, 0xFF],
-                 bytearray([0x54]), bytearray([0xFF, 0x00, 0xA4])])
+                 bytearray([0x54]), bytearray([0xFF, 0x00, 0xA4]), bytes([0x3E]), bytes([0x22, 0xF1, 0x86])])
 def example_raw_bytes(request):
     return request.param
 
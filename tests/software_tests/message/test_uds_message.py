@@ -26,12 +26,12 @@ class TestUdsMessage:
 
     # __init__
 
-    @pytest.mark.parametrize("payload", [None, [0x1, 0x02], "some message"])
+    @pytest.mark.parametrize("payload", [[0x1, 0x02], (0xFF,), "some message"])
     @pytest.mark.parametrize("addressing_type", ["Physical", 0, False, AddressingType.FUNCTIONAL])
     def test_init(self, payload, addressing_type):
         UdsMessage.__init__(self=self.mock_uds_message, payload=payload, addressing_type=addressing_type)
-        assert self.mock_uds_message.payload == payload
-        assert self.mock_uds_message.addressing_type == addressing_type
+        self.mock_uds_message._UdsMessage__set_payload.assert_called_once_with(payload)
+        self.mock_uds_message._UdsMessage__set_addressing_type.assert_called_once_with(addressing_type)
 
     # __eq__
 
@@ -62,12 +62,7 @@ class TestUdsMessage:
 
     def test_payload__set(self, example_raw_bytes):
         UdsMessage.payload.fset(self.mock_uds_message, value=example_raw_bytes)
-        assert self.mock_uds_message._UdsMessage__payload == tuple(example_raw_bytes)
-        self.mock_validate_raw_bytes.assert_called_once_with(example_raw_bytes)
-
-    def test_payload__set_second_call(self, example_raw_bytes):
-        self.mock_uds_message._UdsMessage__payload = "some value"
-        self.test_payload__set(example_raw_bytes=example_raw_bytes)
+        self.mock_uds_message._UdsMessage__set_payload.assert_called_once_with(example_raw_bytes)
 
     # addressing_type
 
@@ -78,12 +73,29 @@ class TestUdsMessage:
 
     def test_addressing_type__set(self, example_addressing_type):
         UdsMessage.addressing_type.fset(self.mock_uds_message, value=example_addressing_type)
+        self.mock_uds_message._UdsMessage__set_addressing_type.assert_called_once_with(example_addressing_type)
+
+    # __set_payload
+
+    def test_set_payload(self, example_raw_bytes):
+        UdsMessage._UdsMessage__set_payload(self=self.mock_uds_message, value=example_raw_bytes)
+        assert self.mock_uds_message._UdsMessage__payload == tuple(example_raw_bytes)
+        self.mock_validate_raw_bytes.assert_called_once_with(example_raw_bytes)
+
+    def test_set_payload__second_call(self, example_raw_bytes):
+        self.mock_uds_message._UdsMessage__payload = "some value"
+        self.test_set_payload(example_raw_bytes=example_raw_bytes)
+
+    # __set_addressing_type
+
+    def test_set_addressing_type(self, example_addressing_type):
+        UdsMessage._UdsMessage__set_addressing_type(self=self.mock_uds_message, value=example_addressing_type)
         assert self.mock_uds_message._UdsMessage__addressing_type == self.mock_validate_addressing.return_value
         self.mock_validate_addressing.assert_called_once_with(example_addressing_type)
 
-    def test_addressing_type__set_second_call(self, example_addressing_type):
+    def test_set_addressing_type__second_call(self, example_addressing_type):
         self.mock_uds_message._UdsMessage__addressing_type = "some value"
-        self.test_addressing_type__set(example_addressing_type=example_addressing_type)
+        self.test_set_addressing_type(example_addressing_type=example_addressing_type)
 
 
 class TestUdsMessageRecord:
@@ -103,10 +115,11 @@ class TestUdsMessageRecord:
 
     # __init__
 
-    @pytest.mark.parametrize("packets_records", [False, [1, 2, 3, 4], "abcdef"])
+    @pytest.mark.parametrize("packets_records", [(Mock(), Mock(), Mock()), [1, 2, 3, 4], "abcdef"])
     def test_init(self, packets_records):
         UdsMessageRecord.__init__(self=self.mock_uds_message_record, packets_records=packets_records)
-        assert self.mock_uds_message_record.packets_records == packets_records
+        assert self.mock_uds_message_record._UdsMessageRecord__packets_records == tuple(packets_records)
+        self.mock_uds_message_record._UdsMessageRecord__validate_packets_records.assert_called_once_with(packets_records)
 
     # __eq__
 
@@ -172,19 +185,9 @@ class TestUdsMessageRecord:
         self.mock_uds_message_record._UdsMessageRecord__packets_records = value
         assert UdsMessageRecord.packets_records.fget(self.mock_uds_message_record) is value
 
-    @pytest.mark.parametrize("packets_records", [
-        (Mock(), Mock(), Mock()),
-        [1, 2, 3, 4],
-        "abcdefg"
-    ])
-    def test_packets_records__set__first_call(self, packets_records):
-        UdsMessageRecord.packets_records.fset(self.mock_uds_message_record, value=packets_records)
-        assert self.mock_uds_message_record._UdsMessageRecord__packets_records == tuple(packets_records)
-        self.mock_uds_message_record._UdsMessageRecord__validate_packets_records.assert_called_once_with(packets_records)
-
     @pytest.mark.parametrize("old_value", [(Mock(), Mock(), Mock()), [1, 2, 3, 4], "abcdefg"])
     @pytest.mark.parametrize("new_value", [(Mock(), Mock(), Mock()), [1, 2, 3, 4], "abcdefg"])
-    def test_packets_records__set__second_call(self, old_value, new_value):
+    def test_packets_records__set(self, old_value, new_value):
         self.mock_uds_message_record._UdsMessageRecord__packets_records = old_value
         with pytest.raises(ReassignmentError):
             UdsMessageRecord.packets_records.fset(self.mock_uds_message_record, value=new_value)
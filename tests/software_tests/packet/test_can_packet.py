@@ -15,6 +15,9 @@ class TestCanPacket:
 
     def setup_method(self):
         self.mock_can_packet = Mock(spec=CanPacket)
+        self.mock_can_packet._CanPacket__addressing_format = Mock()
+        self.mock_can_packet._CanPacket__target_address = Mock()
+        self.mock_can_packet._CanPacket__address_extension = Mock()
         # patching
         self._patcher_warn = patch(f"{SCRIPT_LOCATION}.warn")
         self.mock_warn = self._patcher_warn.start()
@@ -286,15 +289,24 @@ class TestCanPacket:
             addressing_type=addressing_type, can_id=can_id)
         self.mock_can_packet._CanPacket__validate_unambiguous_ai_change.assert_called_once_with(
             CanAddressingFormat.NORMAL_11BIT_ADDRESSING)
-        self.mock_addressing_type_class.assert_called_once_with(addressing_type)
         self.mock_can_packet._CanPacket__update_ai_data_byte.assert_called_once_with()
         assert self.mock_can_packet._CanPacket__addressing_format == CanAddressingFormat.NORMAL_11BIT_ADDRESSING
-        assert self.mock_can_packet._CanPacket__addressing_type == self.mock_addressing_type_class.return_value
+        assert self.mock_can_packet._CanPacket__addressing_type \
+               == self.mock_normal_11bit_ai_class.validate_packet_ai.return_value[
+                   AbstractCanAddressingInformation.ADDRESSING_TYPE_NAME]
         assert self.mock_can_packet._CanPacket__can_id == can_id
         assert self.mock_can_packet._CanPacket__target_address is None
         assert self.mock_can_packet._CanPacket__source_address is None
         assert self.mock_can_packet._CanPacket__address_extension is None
 
+    def test_set_address_information_normal_11bit__first_assignment(self):
+        self.mock_can_packet._CanPacket__addressing_format = None
+        CanPacket.set_address_information_normal_11bit(self=self.mock_can_packet,
+                                                       addressing_type=AddressingType.PHYSICAL,
+                                                       can_id=0x64A)
+        self.mock_can_packet._CanPacket__validate_unambiguous_ai_change.assert_not_called()
+        assert self.mock_can_packet._CanPacket__addressing_format == CanAddressingFormat.NORMAL_11BIT_ADDRESSING
+
     # set_address_information_normal_fixed
 
     @pytest.mark.parametrize("can_id, addressing_type, target_address, source_address", [
@@ -333,7 +345,8 @@ class TestCanPacket:
             CanAddressingFormat.NORMAL_FIXED_ADDRESSING)
         self.mock_can_packet._CanPacket__update_ai_data_byte.assert_called_once_with()
         assert self.mock_can_packet._CanPacket__addressing_format == CanAddressingFormat.NORMAL_FIXED_ADDRESSING
-        assert self.mock_can_packet._CanPacket__addressing_type == self.mock_addressing_type_class.return_value
+        assert self.mock_can_packet._CanPacket__addressing_type \
+               == normalized_params[AbstractCanAddressingInformation.ADDRESSING_TYPE_NAME]
         assert self.mock_can_packet._CanPacket__can_id \
                == normalized_params[AbstractCanAddressingInformation.CAN_ID_NAME]
         assert self.mock_can_packet._CanPacket__target_address \
@@ -342,6 +355,15 @@ class TestCanPacket:
                == normalized_params[AbstractCanAddressingInformation.SOURCE_ADDRESS_NAME]
         assert self.mock_can_packet._CanPacket__address_extension is None
 
+    def test_set_address_information_normal_fixed__first_assignment(self):
+        self.mock_can_packet._CanPacket__addressing_format = None
+        CanPacket.set_address_information_normal_fixed(self=self.mock_can_packet,
+                                                       addressing_type=AddressingType.PHYSICAL,
+                                                       target_address=0x12,
+                                                       source_address=0x34)
+        self.mock_can_packet._CanPacket__validate_unambiguous_ai_change.assert_not_called()
+        assert self.mock_can_packet._CanPacket__addressing_format == CanAddressingFormat.NORMAL_FIXED_ADDRESSING
+
     # set_address_information_extended
 
     @pytest.mark.parametrize("can_id, target_address, addressing_type", [
@@ -361,12 +383,23 @@ class TestCanPacket:
             CanAddressingFormat.EXTENDED_ADDRESSING)
         self.mock_can_packet._CanPacket__update_ai_data_byte.assert_called_once_with()
         assert self.mock_can_packet._CanPacket__addressing_format == CanAddressingFormat.EXTENDED_ADDRESSING
-        assert self.mock_can_packet._CanPacket__addressing_type == self.mock_addressing_type_class.return_value
+        assert self.mock_can_packet._CanPacket__addressing_type \
+               == self.mock_extended_ai_class.validate_packet_ai.return_value[
+                   AbstractCanAddressingInformation.ADDRESSING_TYPE_NAME]
         assert self.mock_can_packet._CanPacket__can_id == can_id
         assert self.mock_can_packet._CanPacket__target_address == target_address
         assert self.mock_can_packet._CanPacket__source_address is None
         assert self.mock_can_packet._CanPacket__address_extension is None
 
+    def test_set_address_information_extended__first_assignment(self):
+        self.mock_can_packet._CanPacket__addressing_format = None
+        CanPacket.set_address_information_extended(self=self.mock_can_packet,
+                                                   addressing_type=AddressingType.PHYSICAL,
+                                                   can_id=0x64A,
+                                                   target_address=0x12)
+        self.mock_can_packet._CanPacket__validate_unambiguous_ai_change.assert_not_called()
+        assert self.mock_can_packet._CanPacket__addressing_format == CanAddressingFormat.EXTENDED_ADDRESSING
+
     # set_address_information_mixed_11bit
 
     @pytest.mark.parametrize("can_id, address_extension, addressing_type", [
@@ -386,12 +419,23 @@ class TestCanPacket:
             CanAddressingFormat.MIXED_11BIT_ADDRESSING)
         self.mock_can_packet._CanPacket__update_ai_data_byte.assert_called_once_with()
         assert self.mock_can_packet._CanPacket__addressing_format == CanAddressingFormat.MIXED_11BIT_ADDRESSING
-        assert self.mock_can_packet._CanPacket__addressing_type == self.mock_addressing_type_class.return_value
+        assert self.mock_can_packet._CanPacket__addressing_type \
+               == self.mock_mixed_11bit_ai_class.validate_packet_ai.return_value[
+                   AbstractCanAddressingInformation.ADDRESSING_TYPE_NAME]
         assert self.mock_can_packet._CanPacket__can_id == can_id
         assert self.mock_can_packet._CanPacket__target_address is None
         assert self.mock_can_packet._CanPacket__source_address is None
         assert self.mock_can_packet._CanPacket__address_extension == address_extension
 
+    def test_set_address_information_mixed_11bit__first_assignment(self):
+        self.mock_can_packet._CanPacket__addressing_format = None
+        CanPacket.set_address_information_mixed_11bit(self=self.mock_can_packet,
+                                                      addressing_type=AddressingType.PHYSICAL,
+                                                      can_id=0x64A,
+                                                      address_extension=0x12)
+        self.mock_can_packet._CanPacket__validate_unambiguous_ai_change.assert_not_called()
+        assert self.mock_can_packet._CanPacket__addressing_format == CanAddressingFormat.MIXED_11BIT_ADDRESSING
+
     # set_address_information_mixed_29bit
 
     @pytest.mark.parametrize("can_id, addressing_type, target_address, source_address, address_extension", [
@@ -434,7 +478,8 @@ class TestCanPacket:
             CanAddressingFormat.MIXED_29BIT_ADDRESSING)
         self.mock_can_packet._CanPacket__update_ai_data_byte.assert_called_once_with()
         assert self.mock_can_packet._CanPacket__addressing_format == CanAddressingFormat.MIXED_29BIT_ADDRESSING
-        assert self.mock_can_packet._CanPacket__addressing_type == self.mock_addressing_type_class.return_value
+        assert self.mock_can_packet._CanPacket__addressing_type \
+               == normalized_params[AbstractCanAddressingInformation.ADDRESSING_TYPE_NAME]
         assert self.mock_can_packet._CanPacket__can_id \
                == normalized_params[AbstractCanAddressingInformation.CAN_ID_NAME]
         assert self.mock_can_packet._CanPacket__target_address \
@@ -443,6 +488,16 @@ class TestCanPacket:
                == normalized_params[AbstractCanAddressingInformation.SOURCE_ADDRESS_NAME]
         assert self.mock_can_packet._CanPacket__address_extension == address_extension
 
+    def test_set_address_information_mixed_29bit__first_assignment(self):
+        self.mock_can_packet._CanPacket__addressing_format = None
+        CanPacket.set_address_information_mixed_29bit(self=self.mock_can_packet,
+                                                      addressing_type=AddressingType.PHYSICAL,
+                                                      target_address=0x12,
+                                                      source_address=0x34,
+                                                      address_extension=0x56)
+        self.mock_can_packet._CanPacket__validate_unambiguous_ai_change.assert_not_called()
+        assert self.mock_can_packet._CanPacket__addressing_format == CanAddressingFormat.MIXED_29BIT_ADDRESSING
+
     # set_packet_data
 
     @pytest.mark.parametrize("packet_type", [None, "unknown"])
@@ -519,9 +574,9 @@ class TestCanPacket:
         CanPacket.set_single_frame_data(self=self.mock_can_packet,
                                         payload=payload)
         self.mock_single_frame_handler_class.create_valid_frame_data.assert_called_once_with(
-            addressing_format=self.mock_can_packet.addressing_format,
-            target_address=self.mock_can_packet.target_address,
-            address_extension=self.mock_can_packet.address_extension,
+            addressing_format=self.mock_can_packet._CanPacket__addressing_format,
+            target_address=self.mock_can_packet._CanPacket__target_address,
+            address_extension=self.mock_can_packet._CanPacket__address_extension,
             payload=payload,
             dlc=None,
             filler_byte=DEFAULT_FILLER_BYTE)
@@ -542,9 +597,9 @@ class TestCanPacket:
                                         filler_byte=filler_byte,
                                         payload=payload)
         self.mock_single_frame_handler_class.create_valid_frame_data.assert_called_once_with(
-            addressing_format=self.mock_can_packet.addressing_format,
-            target_address=self.mock_can_packet.target_address,
-            address_extension=self.mock_can_packet.address_extension,
+            addressing_format=self.mock_can_packet._CanPacket__addressing_format,
+            target_address=self.mock_can_packet._CanPacket__target_address,
+            address_extension=self.mock_can_packet._CanPacket__address_extension,
             payload=payload,
             dlc=dlc,
             filler_byte=filler_byte)
@@ -567,9 +622,9 @@ class TestCanPacket:
                                        data_length=data_length,
                                        dlc=dlc)
         self.mock_first_frame_handler_class.create_valid_frame_data.assert_called_once_with(
-            addressing_format=self.mock_can_packet.addressing_format,
-            target_address=self.mock_can_packet.target_address,
-            address_extension=self.mock_can_packet.address_extension,
+            addressing_format=self.mock_can_packet._CanPacket__addressing_format,
+            target_address=self.mock_can_packet._CanPacket__target_address,
+            address_extension=self.mock_can_packet._CanPacket__address_extension,
             payload=payload,
             dlc=dlc,
             ff_dl=data_length)
@@ -590,9 +645,9 @@ class TestCanPacket:
                                              sequence_number=sequence_number,
                                              payload=payload)
         self.mock_consecutive_frame_handler_class.create_valid_frame_data.assert_called_once_with(
-            addressing_format=self.mock_can_packet.addressing_format,
-            target_address=self.mock_can_packet.target_address,
-            address_extension=self.mock_can_packet.address_extension,
+            addressing_format=self.mock_can_packet._CanPacket__addressing_format,
+            target_address=self.mock_can_packet._CanPacket__target_address,
+            address_extension=self.mock_can_packet._CanPacket__address_extension,
             payload=payload,
             dlc=None,
             filler_byte=DEFAULT_FILLER_BYTE,
@@ -615,9 +670,9 @@ class TestCanPacket:
                                              payload=payload,
                                              sequence_number=sequence_number)
         self.mock_consecutive_frame_handler_class.create_valid_frame_data.assert_called_once_with(
-            addressing_format=self.mock_can_packet.addressing_format,
-            target_address=self.mock_can_packet.target_address,
-            address_extension=self.mock_can_packet.address_extension,
+            addressing_format=self.mock_can_packet._CanPacket__addressing_format,
+            target_address=self.mock_can_packet._CanPacket__target_address,
+            address_extension=self.mock_can_packet._CanPacket__address_extension,
             payload=payload,
             dlc=dlc,
             filler_byte=filler_byte,
@@ -636,9 +691,9 @@ class TestCanPacket:
         CanPacket.set_flow_control_data(self=self.mock_can_packet,
                                         flow_status=flow_status)
         self.mock_flow_control_handler_class.create_valid_frame_data.assert_called_once_with(
-            addressing_format=self.mock_can_packet.addressing_format,
-            target_address=self.mock_can_packet.target_address,
-            address_extension=self.mock_can_packet.address_extension,
+            addressing_format=self.mock_can_packet._CanPacket__addressing_format,
+            target_address=self.mock_can_packet._CanPacket__target_address,
+            address_extension=self.mock_can_packet._CanPacket__address_extension,
             flow_status=flow_status,
             block_size=None,
             st_min=None,
@@ -663,9 +718,9 @@ class TestCanPacket:
                                         dlc=dlc,
                                         filler_byte=filler_byte)
         self.mock_flow_control_handler_class.create_valid_frame_data.assert_called_once_with(
-            addressing_format=self.mock_can_packet.addressing_format,
-            target_address=self.mock_can_packet.target_address,
-            address_extension=self.mock_can_packet.address_extension,
+            addressing_format=self.mock_can_packet._CanPacket__addressing_format,
+            target_address=self.mock_can_packet._CanPacket__target_address,
+            address_extension=self.mock_can_packet._CanPacket__address_extension,
             flow_status=flow_status,
             block_size=block_size,
             st_min=st_min,
@@ -740,11 +795,11 @@ class TestCanPacket:
 
     # __validate_unambiguous_ai_change
 
-    @pytest.mark.parametrize("new_addressing_format", list(CanAddressingFormat))
-    def test_validate_unambiguous_ai_change__none(self, new_addressing_format):
-        self.mock_can_packet.addressing_format = None
+    @pytest.mark.parametrize("addressing_format", list(CanAddressingFormat))
+    def test_validate_unambiguous_ai_change__same(self, addressing_format):
+        self.mock_can_packet._CanPacket__addressing_format = addressing_format
         CanPacket._CanPacket__validate_unambiguous_ai_change(self=self.mock_can_packet,
-                                                             addressing_format=new_addressing_format)
+                                                             addressing_format=addressing_format)
         self.mock_ai_class.get_ai_data_bytes_number.assert_not_called()
 
     @pytest.mark.parametrize("data_bytes_used", [0, 1])
@@ -754,7 +809,7 @@ class TestCanPacket:
     ])
     def test_validate_unambiguous_ai_change__compatible(self, new_addressing_format, old_addressing_format,
                                                         data_bytes_used):
-        self.mock_can_packet.addressing_format = old_addressing_format
+        self.mock_can_packet._CanPacket__addressing_format = old_addressing_format
         self.mock_ai_class.get_number_of_data_bytes_used.return_value = data_bytes_used
         CanPacket._CanPacket__validate_unambiguous_ai_change(self=self.mock_can_packet,
                                                              addressing_format=new_addressing_format)
@@ -768,7 +823,7 @@ class TestCanPacket:
     ])
     def test_validate_unambiguous_ai_change__incompatible(self, new_addressing_format, old_addressing_format,
                                                           data_bytes_used):
-        self.mock_can_packet.addressing_format = old_addressing_format
+        self.mock_can_packet._CanPacket__addressing_format = old_addressing_format
         self.mock_ai_class.get_ai_data_bytes_number.side_effect = data_bytes_used
         with pytest.raises(AmbiguityError):
             CanPacket._CanPacket__validate_unambiguous_ai_change(self=self.mock_can_packet,
@@ -782,7 +837,7 @@ class TestCanPacket:
     @pytest.mark.parametrize("raw_frame_data", [(0x12, 0x34), tuple(range(10))])
     def test_update_ai_data_byte__ignore(self, addressing_format, raw_frame_data):
         self.mock_can_packet._CanPacket__raw_frame_data = None
-        self.mock_can_packet.addressing_format = addressing_format
+        self.mock_can_packet._CanPacket__addressing_format = addressing_format
         CanPacket._CanPacket__update_ai_data_byte(self=self.mock_can_packet)
         assert self.mock_can_packet._CanPacket__raw_frame_data is None
         self.mock_ai_class.encode_ai_data_bytes.assert_not_called()
@@ -793,14 +848,14 @@ class TestCanPacket:
     def test_update_ai_data_byte(self, addressing_format, raw_frame_data, ai_data_bytes):
         self.mock_ai_class.encode_ai_data_bytes.return_value = ai_data_bytes
         self.mock_can_packet._CanPacket__raw_frame_data = raw_frame_data
-        self.mock_can_packet.addressing_format = addressing_format
+        self.mock_can_packet._CanPacket__addressing_format = addressing_format
         CanPacket._CanPacket__update_ai_data_byte(self=self.mock_can_packet)
         assert self.mock_can_packet._CanPacket__raw_frame_data[:len(ai_data_bytes)] == tuple(ai_data_bytes)
         assert self.mock_can_packet._CanPacket__raw_frame_data[len(ai_data_bytes):] == tuple(raw_frame_data[len(ai_data_bytes):])
         self.mock_ai_class.encode_ai_data_bytes.assert_called_once_with(
-            addressing_format=self.mock_can_packet.addressing_format,
-            target_address=self.mock_can_packet.target_address,
-            address_extension=self.mock_can_packet.address_extension)
+            addressing_format=self.mock_can_packet._CanPacket__addressing_format,
+            target_address=self.mock_can_packet._CanPacket__target_address,
+            address_extension=self.mock_can_packet._CanPacket__address_extension)
 
 
 @pytest.mark.integration
@@ -910,6 +965,25 @@ class TestCanPacketIntegration:
         packet = CanPacket(**init_kwargs)
         for attr_name, attr_value in expected_attribute_values.items():
             assert getattr(packet, attr_name) == attr_value
+        assert not hasattr(packet, "__dict__")
+
+    @pytest.mark.parametrize("addressing_type", list(AddressingType))
+    @pytest.mark.parametrize("ai_kwargs", [
+        {"addressing_format": CanAddressingFormat.NORMAL_11BIT_ADDRESSING, "can_id": 0x7E0},
+        {"addressing_format": CanAddressingFormat.NORMAL_FIXED_ADDRESSING, "target_address": 0x12,
+         "source_address": 0xF1},
+        {"addressing_format": CanAddressingFormat.EXTENDED_ADDRESSING, "can_id": 0x7E0, "target_address": 0x12},
+        {"addressing_format": CanAddressingFormat.MIXED_11BIT_ADDRESSING, "can_id": 0x7E0, "address_extension": 0x12},
+        {"addressing_format": CanAddressingFormat.MIXED_29BIT_ADDRESSING, "target_address": 0x12,
+         "source_address": 0xF1, "address_extension": 0x00},
+    ])
+    def test_init__addressing_type_value(self, addressing_type, ai_kwargs):
+        packet = CanPacket(packet_type=CanPacketType.CONSECUTIVE_FRAME,
+                           addressing_type=addressing_type.value,
+                           payload=[0x3E],
+                           sequence_number=0xF,
+                           **ai_kwargs)
+        assert packet.addressing_type is addressing_type
 
     # changing addressing information
 
@@ -52,7 +52,12 @@ class TestCanPacketRecord:
         ("some addressing type", "some format", "some timestamp"),
         ("Another type", "another format", 9.543),
     ])
-    def test_init(self, frame, direction, addressing_type, addressing_format, transmission_time):
+    @pytest.mark.parametrize("raw_frame_data", [range(10), [0xFE, 0xDC, 0xBA, 0x98]])
+    @pytest.mark.parametrize("ai_data_bytes_number", [0, 1])
+    def test_init(self, frame, direction, addressing_type, addressing_format, transmission_time,
+                  raw_frame_data, ai_data_bytes_number):
+        self.mock_can_packet_record._CanPacketRecord__extract_raw_frame_data.return_value = raw_frame_data
+        self.mock_can_ai_class.get_ai_data_bytes_number.return_value = ai_data_bytes_number
         CanPacketRecord.__init__(self=self.mock_can_packet_record,
                                  frame=frame,
                                  direction=direction,
@@ -66,22 +71,95 @@ class TestCanPacketRecord:
         self.mock_abstract_uds_packet_record_init.assert_called_once_with(frame=frame,
                                                                           direction=direction,
                                                                           transmission_time=transmission_time)
-        self.mock_can_packet_record._CanPacketRecord__assess_packet_type.assert_called_once_with()
-        self.mock_can_packet_record._CanPacketRecord__assess_ai_attributes.assert_called_once_with()
+        self.mock_can_packet_record._CanPacketRecord__extract_raw_frame_data.assert_called_once_with(frame)
+        assert self.mock_can_packet_record._CanPacketRecord__raw_frame_data == raw_frame_data
+        self.mock_can_dlc_handler_class.encode_dlc.assert_called_once_with(len(raw_frame_data))
+        assert self.mock_can_packet_record._CanPacketRecord__dlc == self.mock_can_dlc_handler_class.encode_dlc.return_value
+        assert self.mock_can_packet_record._CanPacketRecord__packet_type \
+               == self.mock_can_packet_type_class.validate_member.return_value
+        self.mock_can_ai_class.get_ai_data_bytes_number.assert_called_once_with(
+            self.mock_can_addressing_format_class.validate_member.return_value)
+        self.mock_can_packet_type_class.validate_member.assert_called_once_with(
+            raw_frame_data[ai_data_bytes_number] >> 4)
+        self.mock_can_packet_record._CanPacketRecord__assess_ai_attributes.assert_called_once_with(ai_data_bytes_number)
         self.mock_addressing_type_class.validate_member.assert_called_once_with(addressing_type)
         self.mock_can_addressing_format_class.validate_member.assert_called_once_with(addressing_format)
 
+    # from_frames
+
+    @pytest.mark.parametrize("frames, transmission_times", [
+        ([], []),
+        (["frame 1"], ["time 1"]),
+        (["frame 1", "frame 2", "frame 3"], ["time 1", "time 2", "time 3"]),
+    ])
+    @patch(f"{SCRIPT_LOCATION}.TransmissionDirection")
+    def test_from_frames(self, mock_transmission_direction_class, frames, transmission_times):
+        mock_cls = Mock()
+        records = CanPacketRecord.from_frames.__func__(mock_cls,
+                                                       frames=frames,
+                                                       direction="direction",
+                                                       addressing_type="addressing type",
+                                                       addressing_format="addressing format",
+                                                       transmission_times=transmission_times)
+        assert records == [mock_cls.return_value] * len(frames)
+        assert mock_cls.call_count == len(frames)
+        for frame, transmission_time in zip(frames, transmission_times):
+            mock_cls.assert_any_call(
+                frame=frame,
+                direction=mock_transmission_direction_class.validate_member.return_value,
+                addressing_type=self.mock_addressing_type_class.validate_member.return_value,
+                addressing_format=self.mock_can_addressing_format_class.validate_member.return_value,
+                transmission_time=transmission_time)
+        mock_transmission_direction_class.validate_member.assert_called_once_with("direction")
+        self.mock_addressing_type_class.validate_member.assert_called_once_with("addressing type")
+        self.mock_can_addressing_format_class.validate_member.assert_called_once_with("addressing format")
+
+    @pytest.mark.parametrize("frames, transmission_times", [
+        ([], ["time 1"]),
+        (["frame 1", "frame 2"], ["time 1"]),
+    ])
+    def test_from_frames__inconsistent(self, frames, transmission_times):
+        mock_cls = Mock()
+        with pytest.raises(InconsistentArgumentsError):
+            CanPacketRecord.from_frames.__func__(mock_cls,
+                                                 frames=frames,
+                                                 direction="direction",
+                                                 addressing_type="addressing type",
+                                                 addressing_format="addressing format",
+                                                 transmission_times=transmission_times)
+        mock_cls.assert_not_called()
+
+    # __str__
+
+    def test_str(self):
+        output = CanPacketRecord.__str__(self=self.mock_can_packet_record)
+        assert output.startswith(f"{CanPacketRecord.__name__}(") and output.endswith(")")
+        assert f"direction={self.mock_can_packet_record.direction}" in output
+        assert f"packet_type={self.mock_can_packet_record.packet_type}" in output
+        assert f"raw_frame_data={self.mock_can_packet_record.raw_frame_data}" in output
+        assert f"can_id={self.mock_can_packet_record.can_id}" in output
+        assert f"dlc={self.mock_can_packet_record.dlc}" in output
+        assert f"addressing_format={self.mock_can_packet_record.addressing_format}" in output
+        assert f"addressing_type={self.mock_can_packet_record.addressing_type}" in output
+        assert f"target_address={self.mock_can_packet_record.target_address}" in output
+        assert f"source_address={self.mock_can_packet_record.source_address}" in output
+        assert f"address_extension={self.mock_can_packet_record.address_extension}" in output
+        assert f"transmission_time={self.mock_can_packet_record.transmission_time}" in output
+        assert f"frame={self.mock_can_packet_record.frame}" in output
+
     # raw_frame_data
 
-    @pytest.mark.parametrize("raw_frame_data", ["some raw data", range(10)])
-    def test_raw_frame_data__python_can(self, raw_frame_data):
-        self.mock_can_packet_record.frame = Mock(spec=PythonCanMessage, data=raw_frame_data)
-        assert CanPacketRecord.raw_frame_data.fget(self.mock_can_packet_record) \
-               == tuple(self.mock_can_packet_record.frame.data)
+    @pytest.mark.parametrize("raw_frame_data", ["some raw data", (0x12, 0x34)])
+    def test_raw_frame_data__get(self, raw_frame_data):
+        self.mock_can_packet_record._CanPacketRecord__raw_frame_data = raw_frame_data
+        assert CanPacketRecord.raw_frame_data.fget(self.mock_can_packet_record) == raw_frame_data
 
-    def test_raw_frame_data__not_implemented(self):
-        with pytest.raises(NotImplementedError):
-            CanPacketRecord.raw_frame_data.fget(self.mock_can_packet_record)
+    # dlc
+
+    @pytest.mark.parametrize("dlc", [8, 0xF])
+    def test_dlc__get(self, dlc):
+        self.mock_can_packet_record._CanPacketRecord__dlc = dlc
+        assert CanPacketRecord.dlc.fget(self.mock_can_packet_record) == dlc
 
     # can_id
 
@@ -150,20 +228,17 @@ class TestCanPacketRecord:
         self.mock_can_dlc_handler_class.validate_data_bytes_number.assert_called_once_with(
             len(example_python_can_message.data))
 
-    # __assess_packet_type
+    # __extract_raw_frame_data
 
-    @pytest.mark.parametrize("raw_frame_data", [range(10), [0xFE, 0xDC, 0xBA, 0x98]])
-    @pytest.mark.parametrize("ai_data_bytes_number", [0, 1])
-    def test_assess_packet_type(self, raw_frame_data, ai_data_bytes_number):
-        self.mock_can_packet_record.raw_frame_data = raw_frame_data
-        self.mock_can_ai_class.get_ai_data_bytes_number.return_value = ai_data_bytes_number
-        assert CanPacketRecord._CanPacketRecord__assess_packet_type(self=self.mock_can_packet_record) is None
-        assert self.mock_can_packet_record._CanPacketRecord__packet_type \
-               == self.mock_can_packet_type_class.validate_member.return_value
-        n_pci_value = raw_frame_data[ai_data_bytes_number] >> 4
-        self.mock_can_ai_class.get_ai_data_bytes_number.assert_called_once_with(
-            self.mock_can_packet_record.addressing_format)
-        self.mock_can_packet_type_class.validate_member.assert_called_once_with(n_pci_value)
+    @pytest.mark.parametrize("raw_frame_data", ["some raw data", range(10)])
+    def test_extract_raw_frame_data__python_can(self, raw_frame_data):
+        frame = Mock(spec=PythonCanMessage, data=raw_frame_data)
+        assert CanPacketRecord._CanPacketRecord__extract_raw_frame_data(frame) == tuple(raw_frame_data)
+
+    @pytest.mark.parametrize("frame", [None, "some frame", Mock()])
+    def test_extract_raw_frame_data__not_implemented(self, frame):
+        with pytest.raises(NotImplementedError):
+            CanPacketRecord._CanPacketRecord__extract_raw_frame_data(frame)
 
     # __assess_ai_attributes
 
@@ -184,14 +259,14 @@ class TestCanPacketRecord:
     @pytest.mark.parametrize("ai_data_bytes_number", [0, 1])
     def test_assess_ai_attributes(self, addressing_format, can_id, raw_frame_data,
                                   ai_data_bytes_number, decoded_ai):
-        self.mock_can_packet_record.addressing_format = addressing_format
+        self.mock_can_packet_record._CanPacketRecord__addressing_format = addressing_format
         self.mock_can_packet_record.can_id = can_id
-        self.mock_can_packet_record.raw_frame_data = raw_frame_data
-        self.mock_can_packet_record.addressing_type = "Some Addressing"
-        self.mock_can_ai_class.get_ai_data_bytes_number.return_value = ai_data_bytes_number
+        self.mock_can_packet_record._CanPacketRecord__raw_frame_data = raw_frame_data
+        self.mock_can_packet_record._CanPacketRecord__addressing_type = "Some Addressing"
         self.mock_can_ai_class.decode_packet_ai.return_value = decoded_ai
-        assert CanPacketRecord._CanPacketRecord__assess_ai_attributes(self=self.mock_can_packet_record) is None
-        self.mock_can_ai_class.get_ai_data_bytes_number.assert_called_once_with(addressing_format)
+        assert CanPacketRecord._CanPacketRecord__assess_ai_attributes(self=self.mock_can_packet_record,
+                                                                      ai_data_bytes_number=ai_data_bytes_number) is None
+        self.mock_can_ai_class.get_ai_data_bytes_number.assert_not_called()
         self.mock_can_ai_class.decode_packet_ai.assert_called_once_with(addressing_format=addressing_format,
                                                                         can_id=can_id,
                                                                         ai_data_bytes=raw_frame_data[:ai_data_bytes_number])
@@ -216,14 +291,14 @@ class TestCanPacketRecord:
     @pytest.mark.parametrize("ai_data_bytes_number", [0, 1])
     def test_assess_ai_attributes__inconsistent_addressing(self, addressing_format, can_id, raw_frame_data,
                                                            ai_data_bytes_number, decoded_ai):
-        self.mock_can_packet_record.addressing_format = addressing_format
+        self.mock_can_packet_record._CanPacketRecord__addressing_format = addressing_format
         self.mock_can_packet_record.can_id = can_id
-        self.mock_can_packet_record.raw_frame_data = raw_frame_data
-        self.mock_can_ai_class.get_ai_data_bytes_number.return_value = ai_data_bytes_number
+        self.mock_can_packet_record._CanPacketRecord__raw_frame_data = raw_frame_data
         self.mock_can_ai_class.decode_packet_ai.return_value = decoded_ai
         with pytest.raises(InconsistentArgumentsError):
-            CanPacketRecord._CanPacketRecord__assess_ai_attributes(self=self.mock_can_packet_record)
-        self.mock_can_ai_class.get_ai_data_bytes_number.assert_called_once_with(addressing_format)
+            CanPacketRecord._CanPacketRecord__assess_ai_attributes(self=self.mock_can_packet_record,
+                                                                   ai_data_bytes_number=ai_data_bytes_number)
+        self.mock_can_ai_class.get_ai_data_bytes_number.assert_not_called()
         self.mock_can_ai_class.decode_packet_ai.assert_called_once_with(addressing_format=addressing_format,
                                                                         can_id=can_id,
                                                                         ai_data_bytes=raw_frame_data[:ai_data_bytes_number])
@@ -290,6 +365,7 @@ class TestCanPacketRecordIntegration:
             assert getattr(packet_record, attr_name) == attr_value
         assert packet_record.frame == kwargs["frame"]
         assert packet_record.transmission_time == kwargs["transmission_time"]
+        assert not hasattr(packet_record, "__dict__")
 
     @pytest.mark.parametrize("kwargs", [
         {"frame": PythonCanMessage(arbitration_id=0x68A,
@@ -312,3 +388,27 @@ class TestCanPacketRecordIntegration:
     def test_init__invalid(self, kwargs):
         with pytest.raises(ValueError):
             CanPacketRecord(**kwargs)
+
+    def test_from_frames(self):
+        frames = [PythonCanMessage(arbitration_id=0x7E8, data=[0x10, 0x0A, 0x62, 0xF1, 0x90, 0x57, 0x30, 0x4C]),
+                  PythonCanMessage(arbitration_id=0x7E8, data=[0x21, 0x30, 0x30, 0x30, 0x30, 0xCC, 0xCC, 0xCC])]
+        transmission_times = [datetime.now(), datetime.now()]
+        packet_records = CanPacketRecord.from_frames(frames=frames,
+                                                     direction=TransmissionDirection.RECEIVED,
+                                                     addressing_type=AddressingType.PHYSICAL,
+                                                     addressing_format=CanAddressingFormat.NORMAL_11BIT_ADDRESSING,
+                                                     transmission_times=transmission_times)
+        assert [packet_record.frame for packet_record in packet_records] == frames
+        assert [packet_record.transmission_time for packet_record in packet_records] == transmission_times
+        assert [packet_record.packet_type for packet_record in packet_records] \
+               == [CanPacketType.FIRST_FRAME, CanPacketType.CONSECUTIVE_FRAME]
+
+    @pytest.mark.parametrize("pci_byte", range(0x40, 0x100, 0x1F))
+    def test_init__unknown_packet_type(self, pci_byte):
+        frame = PythonCanMessage(arbitration_id=0x7E0, data=[pci_byte] + [0xCC] * 7)
+        with pytest.raises(ValueError):
+            CanPacketRecord(frame=frame,
+                            direction=TransmissionDirection.RECEIVED,
+                            addressing_type=AddressingType.PHYSICAL,
+                            addressing_format=CanAddressingFormat.NORMAL_11BIT_ADDRESSING,
+                            transmission_time=datetime.now())
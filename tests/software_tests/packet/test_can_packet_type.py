@@ -1,19 +1,26 @@
 import pytest
 from mock import patch
 
-from uds.packet.can_packet_type import CanPacketType
+from uds.packet.can_packet_type import CanPacketType, CanAddressingFormat
 from uds.packet import AbstractUdsPacketType
 
 
+SCRIPT_LOCATION = "uds.packet.can_packet_type"
+
+
 class TestCanPacketType:
     """Unit tests for `CanPacketType` class."""
 
     def setup_method(self):
         self._patcher_validate_member = patch("uds.utilities.ValidatedEnum.validate_member")
         self.mock_validate_member = self._patcher_validate_member.start()
+        self._patcher_get_ai_data_bytes_number = \
+            patch(f"{SCRIPT_LOCATION}.CanAddressingInformation.get_ai_data_bytes_number")
+        self.mock_get_ai_data_bytes_number = self._patcher_get_ai_data_bytes_number.start()
 
     def teardown_method(self):
         self._patcher_validate_member.stop()
+        self._patcher_get_ai_data_bytes_number.stop()
 
     # inheritance
 
@@ -33,3 +40,30 @@ class TestCanPacketType:
         self.mock_validate_member.side_effect = lambda arg: arg
         assert CanPacketType.is_initial_packet_type(value) is True
         self.mock_validate_member.assert_called_once_with(value)
+
+    # decode_packet_types
+
+    @pytest.mark.parametrize("addressing_format", ["some format", CanAddressingFormat.EXTENDED_ADDRESSING])
+    @pytest.mark.parametrize("ai_data_bytes_number, raw_frames_data, expected_n_pci_values", [
+        (0, [], []),
+        (0, [(0x02, 0x3E, 0x00), bytes([0x30, 0x00, 0x00]), [0xF5]], [0x0, 0x3, 0xF]),
+        (1, [(0xFF, 0x10, 0x0A), bytearray([0x00, 0x21, 0x01]), [0x8B, 0xEF]], [0x1, 0x2, 0xE]),
+    ])
+    def test_decode_packet_types(self, addressing_format, ai_data_bytes_number, raw_frames_data,
+                                 expected_n_pci_values):
+        self.mock_validate_member.side_effect = lambda arg: arg
+        self.mock_get_ai_data_bytes_number.return_value = ai_data_bytes_number
+        assert CanPacketType.decode_packet_types(addressing_format=addressing_format,
+                                                 raw_frames_data=raw_frames_data) == expected_n_pci_values
+        self.mock_get_ai_data_bytes_number.assert_called_once_with(addressing_format)
+        assert self.mock_validate_member.call_count == len(raw_frames_data)
+
+    @pytest.mark.parametrize("ai_data_bytes_number, raw_frames_data", [
+        (0, [(0x02, 0x3E, 0x00), ()]),
+        (1, [(0xFF,)]),
+    ])
+    def test_decode_packet_types__too_short(self, ai_data_bytes_number, raw_frames_data):
+        self.mock_get_ai_data_bytes_number.return_value = ai_data_bytes_number
+        with pytest.raises(IndexError):
+            CanPacketType.decode_packet_types(addressing_format=CanAddressingFormat.EXTENDED_ADDRESSING,
+                                              raw_frames_data=raw_frames_data)
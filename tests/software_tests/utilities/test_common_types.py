@@ -1,4 +1,5 @@
 import pytest
+from mock import Mock, MagicMock
 
 from uds.utilities.common_types import validate_raw_bytes, validate_raw_byte, validate_nibble
 
@@ -43,12 +44,12 @@ class TestFunctions:
     def test_validate_raw_bytes__valid(self, example_raw_bytes):
         assert validate_raw_bytes(value=example_raw_bytes) is None
 
-    @pytest.mark.parametrize("value", [tuple(), [], bytearray()])
+    @pytest.mark.parametrize("value", [tuple(), [], bytearray(), bytes()])
     def test_validate_raw_bytes__invalid_empty(self, value):
         with pytest.raises(ValueError):
             validate_raw_bytes(value=value)
 
-    @pytest.mark.parametrize("value", [tuple(), [], bytearray()])
+    @pytest.mark.parametrize("value", [tuple(), [], bytearray(), bytes()])
     def test_validate_raw_bytes__valid_empty(self, value):
         validate_raw_bytes(value=value, allow_empty=True)
 
@@ -58,7 +59,8 @@ class TestFunctions:
         with pytest.raises(TypeError):
             validate_raw_bytes(value=invalid_raw_bytes, allow_empty=allow_empty)
 
-    @pytest.mark.parametrize("invalid_raw_bytes", [[-1], (0x100,), [1, 0.2], [22, "1"], (None, 0)])
+    @pytest.mark.parametrize("invalid_raw_bytes", [[-1], (0x100,), [1, 0.2], [22, "1"], (None, 0),
+                                                   [MagicMock(__index__=Mock(return_value=0x12))]])
     @pytest.mark.parametrize("allow_empty", [True, False])
     def test_validate_raw_bytes__invalid_value(self, invalid_raw_bytes, allow_empty):
         with pytest.raises(ValueError):
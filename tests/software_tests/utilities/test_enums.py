@@ -130,6 +130,17 @@ class TestValidatedEnum:
         with pytest.raises(ValueError):
             enum_class.validate_member(not_member)
 
+    @pytest.mark.parametrize("enum_class", [ExampleByteEnum1, ExampleByteEnum2])
+    @pytest.mark.parametrize("not_member", [["x", "y"], {"some": "dict"}, {1, 2}])
+    def test_validate_member__invalid_unhashable(self, enum_class, not_member):
+        with pytest.raises(ValueError):
+            enum_class.validate_member(not_member)
+
+    @pytest.mark.parametrize("enum_class", [ExampleByteEnum1, ExampleByteEnum2])
+    def test_validate_member__repeated(self, enum_class):
+        for member in enum_class:
+            assert enum_class.validate_member(member.value) is enum_class.validate_member(member.value) is member
+
 
 class TestExtendableEnum:
     """Unit tests for 'ExtendableEnum' class."""
@@ -278,3 +289,13 @@ class TestMultipleEnums:
         assert member.name == name
         assert member.value == value
         assert isinstance(member, enum_class)
+
+    @pytest.mark.parametrize("name, value", [
+        ("NewValue1", 0x01),
+        ("NewValue2", 0xFE),
+    ])
+    def test_validate_member__added_member(self, name, value):
+        with pytest.raises(ValueError):
+            self.ExtendableByteEnumWithValidated.validate_member(value)
+        member = self.ExtendableByteEnumWithValidated.add_member(name=name, value=value)
+        assert self.ExtendableByteEnumWithValidated.validate_member(value) is member
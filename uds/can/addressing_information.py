@@ -192,15 +192,15 @@ class CanAddressingInformation:
 
         :return: List of data bytes that carry Addressing Information in CAN frame Data field.
         """
-        CanAddressingFormat.validate_member(addressing_format)
-        if addressing_format in (CanAddressingFormat.NORMAL_11BIT_ADDRESSING,
-                                 CanAddressingFormat.NORMAL_FIXED_ADDRESSING):
+        addressing_format = CanAddressingFormat.validate_member(addressing_format)
+        if addressing_format is CanAddressingFormat.NORMAL_11BIT_ADDRESSING \
+                or addressing_format is CanAddressingFormat.NORMAL_FIXED_ADDRESSING:
             return []
-        if addressing_format == CanAddressingFormat.EXTENDED_ADDRESSING:
+        if addressing_format is CanAddressingFormat.EXTENDED_ADDRESSING:
             validate_raw_byte(target_address)  # type: ignore
             return [target_address]  # type: ignore
-        if addressing_format in (CanAddressingFormat.MIXED_11BIT_ADDRESSING,
-                                 CanAddressingFormat.MIXED_29BIT_ADDRESSING):
+        if addressing_format is CanAddressingFormat.MIXED_11BIT_ADDRESSING \
+                or addressing_format is CanAddressingFormat.MIXED_29BIT_ADDRESSING:
             validate_raw_byte(address_extension)  # type: ignore
             return [address_extension]  # type: ignore
         raise NotImplementedError(f"Missing implementation for: {addressing_format}")
@@ -68,7 +68,7 @@ class CanConsecutiveFrameHandler:
                                                                       target_address=target_address,
                                                                       address_extension=address_extension)
         sn_data_bytes = cls.__encode_sn(sequence_number=sequence_number)
-        cf_bytes = ai_data_bytes + sn_data_bytes + list(payload)
+        cf_bytes = [*ai_data_bytes, *sn_data_bytes, *payload]
         if len(cf_bytes) > frame_data_bytes_number:
             raise InconsistentArgumentsError("Provided value of `payload` contains of too many bytes to fit in. "
                                              "Consider increasing DLC value.")
@@ -77,7 +77,7 @@ class CanConsecutiveFrameHandler:
             if dlc is not None and dlc < CanDlcHandler.MIN_BASE_UDS_DLC:
                 raise InconsistentArgumentsError(f"CAN Frame Data Padding shall not be used for CAN frames with "
                                                  f"DLC < {CanDlcHandler.MIN_BASE_UDS_DLC}. Actual value: dlc={dlc}")
-            return cf_bytes + data_bytes_to_pad * [filler_byte]
+            cf_bytes.extend(data_bytes_to_pad * [filler_byte])
         return cf_bytes
 
     @classmethod
@@ -120,12 +120,12 @@ class CanConsecutiveFrameHandler:
                                                                       target_address=target_address,
                                                                       address_extension=address_extension)
         sn_data_bytes = cls.__encode_sn(sequence_number=sequence_number)
-        cf_bytes = ai_data_bytes + sn_data_bytes + list(payload)
+        cf_bytes = [*ai_data_bytes, *sn_data_bytes, *payload]
         if len(cf_bytes) > frame_data_bytes_number:
             raise InconsistentArgumentsError("Provided value of `payload` contains of too many bytes to fit in. "
                                              "Consider increasing DLC value.")
-        data_padding = ((frame_data_bytes_number - len(cf_bytes)) * [filler_byte])
-        return cf_bytes + data_padding
+        cf_bytes.extend((frame_data_bytes_number - len(cf_bytes)) * [filler_byte])
+        return cf_bytes
 
     @classmethod
     def is_consecutive_frame(cls, addressing_format: CanAddressingFormat, raw_frame_data: RawBytesAlias) -> bool:
@@ -68,7 +68,7 @@ class CanFirstFrameHandler:
                                                                       target_address=target_address,
                                                                       address_extension=address_extension)
         ff_dl_data_bytes = cls.__encode_valid_ff_dl(ff_dl=ff_dl, dlc=dlc, addressing_format=addressing_format)
-        ff_data_bytes = list(ai_data_bytes) + list(ff_dl_data_bytes) + list(payload)
+        ff_data_bytes = [*ai_data_bytes, *ff_dl_data_bytes, *payload]
         frame_length = CanDlcHandler.decode_dlc(dlc)
         if len(ff_data_bytes) != frame_length:
             raise InconsistentArgumentsError("Provided value of `payload` contains incorrect number of bytes to fit "
@@ -113,7 +113,7 @@ class CanFirstFrameHandler:
                                                                       target_address=target_address,
                                                                       address_extension=address_extension)
         ff_dl_data_bytes = cls.__encode_any_ff_dl(ff_dl=ff_dl, long_ff_dl_format=long_ff_dl_format)
-        ff_data_bytes = list(ai_data_bytes) + list(ff_dl_data_bytes) + list(payload)
+        ff_data_bytes = [*ai_data_bytes, *ff_dl_data_bytes, *payload]
         frame_length = CanDlcHandler.decode_dlc(dlc)
         if len(ff_data_bytes) != frame_length:
             raise InconsistentArgumentsError("Provided value of `payload` contains incorrect number of bytes to fit "
@@ -218,7 +218,7 @@ class CanFlowControlHandler:
                                                        block_size=block_size,
                                                        st_min=st_min,
                                                        filler_byte=filler_byte)
-        fc_bytes = ai_data_bytes + fs_data_bytes
+        fc_bytes = [*ai_data_bytes, *fs_data_bytes]
         if len(fc_bytes) > frame_data_bytes_number:
             raise InconsistentArgumentsError("Provided value of `dlc` is too small.")
         data_bytes_to_pad = frame_data_bytes_number - len(fc_bytes)
@@ -226,7 +226,7 @@ class CanFlowControlHandler:
             if dlc is not None and dlc < CanDlcHandler.MIN_BASE_UDS_DLC:
                 raise InconsistentArgumentsError(f"CAN Frame Data Padding shall not be used for CAN frames with "
                                                  f"DLC < {CanDlcHandler.MIN_BASE_UDS_DLC}. Actual value: dlc={dlc}")
-            return fc_bytes + data_bytes_to_pad * [filler_byte]
+            fc_bytes.extend(data_bytes_to_pad * [filler_byte])
         return fc_bytes
 
     @classmethod
@@ -272,12 +272,12 @@ class CanFlowControlHandler:
         fs_data_bytes = cls.__encode_any_flow_status(flow_status=flow_status,
                                                      block_size=block_size,
                                                      st_min=st_min)
-        fc_bytes = ai_data_bytes + fs_data_bytes
+        fc_bytes = [*ai_data_bytes, *fs_data_bytes]
         if len(fc_bytes) > frame_data_bytes_number:
             raise InconsistentArgumentsError("Provided value of `dlc` is too small.")
         data_bytes_to_pad = frame_data_bytes_number - len(fc_bytes)
         if data_bytes_to_pad > 0:
-            return fc_bytes + data_bytes_to_pad * [filler_byte]
+            fc_bytes.extend(data_bytes_to_pad * [filler_byte])
         return fc_bytes
 
     @classmethod
@@ -319,7 +319,7 @@ class CanFlowControlHandler:
             raise ValueError(f"Provided `raw_frame_data` value does not carry a Flow Control packet. "
                              f"Actual values: addressing_format={addressing_format}, raw_frame_data={raw_frame_data}")
         ai_bytes_number = CanAddressingInformation.get_ai_data_bytes_number(addressing_format)
-        return CanFlowStatus(raw_frame_data[ai_bytes_number] & 0xF)
+        return CanFlowStatus.validate_member(raw_frame_data[ai_bytes_number] & 0xF)
 
     @classmethod
     def decode_block_size(cls, addressing_format: CanAddressingFormat, raw_frame_data: RawBytesAlias) -> int:
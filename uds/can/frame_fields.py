@@ -183,12 +183,12 @@ class CanIdHandler:
         :return: Value of CAN ID (compatible with Normal Fixed Addressing Format) that was generated from
             the provided values.
         """
-        AddressingType.validate_member(addressing_type)
+        addressing_type = AddressingType.validate_member(addressing_type)
         validate_raw_byte(target_address)
         validate_raw_byte(source_address)
-        if addressing_type == AddressingType.PHYSICAL:
+        if addressing_type is AddressingType.PHYSICAL:
             return cls.NORMAL_FIXED_PHYSICAL_ADDRESSING_OFFSET + (target_address << 8) + source_address
-        if addressing_type == AddressingType.FUNCTIONAL:
+        if addressing_type is AddressingType.FUNCTIONAL:
             return cls.NORMAL_FIXED_FUNCTIONAL_ADDRESSING_OFFSET + (target_address << 8) + source_address
         raise NotImplementedError(f"Unknown addressing type value was provided: {addressing_type}")
 
@@ -211,12 +211,12 @@ class CanIdHandler:
         :return: Value of CAN ID (compatible with Mixed 29-bit Addressing Format) that was generated from
             the provided values.
         """
-        AddressingType.validate_member(addressing_type)
+        addressing_type = AddressingType.validate_member(addressing_type)
         validate_raw_byte(target_address)
         validate_raw_byte(source_address)
-        if addressing_type == AddressingType.PHYSICAL:
+        if addressing_type is AddressingType.PHYSICAL:
             return cls.MIXED_29BIT_PHYSICAL_ADDRESSING_OFFSET + (target_address << 8) + source_address
-        if addressing_type == AddressingType.FUNCTIONAL:
+        if addressing_type is AddressingType.FUNCTIONAL:
             return cls.MIXED_29BIT_FUNCTIONAL_ADDRESSING_OFFSET + (target_address << 8) + source_address
         raise NotImplementedError(f"Unknown addressing type value was provided: {addressing_type}")
 
@@ -441,7 +441,8 @@ class CanDlcHandler:
 
         :return: Number of data bytes in a CAN frame that is represented by provided DLC value.
         """
-        cls.validate_dlc(dlc)
+        if not isinstance(dlc, int) or dlc not in cls.__DLC_MAPPING:
+            cls.validate_dlc(dlc)
         return cls.__DLC_MAPPING[dlc]
 
     @classmethod
@@ -453,7 +454,8 @@ class CanDlcHandler:
 
         :return: DLC value of a CAN frame that represents provided number of data bytes.
         """
-        cls.validate_data_bytes_number(data_bytes_number, True)
+        if not isinstance(data_bytes_number, int) or data_bytes_number not in cls.__DATA_BYTES_NUMBER_MAPPING:
+            cls.validate_data_bytes_number(data_bytes_number, True)
         return cls.__DATA_BYTES_NUMBER_MAPPING[data_bytes_number]
 
     @classmethod
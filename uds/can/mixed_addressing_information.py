@@ -46,7 +46,7 @@ class Mixed11BitCanAddressingInformation(AbstractCanAddressingInformation):
         if (target_address, source_address) != (None, None):
             raise UnusedArgumentError("Values of Target Address and Source Address are not supported by "
                                       "Mixed 11-bit Addressing format and all must be None.")
-        AddressingType.validate_member(addressing_type)
+        addressing_type = AddressingType.validate_member(addressing_type)
         CanIdHandler.validate_can_id(can_id)  # type: ignore
         validate_raw_byte(address_extension)  # type: ignore
         if not CanIdHandler.is_mixed_11bit_addressed_can_id(can_id):  # type: ignore
@@ -100,8 +100,6 @@ class Mixed29BitCanAddressingInformation(AbstractCanAddressingInformation):
                                                  f"if can_id value is None for Mixed 29-bit Addressing Format. "
                                                  f"Actual values: "
                                                  f"target_address={target_address}, source_address={source_address}")
-            validate_raw_byte(target_address)  # type: ignore
-            validate_raw_byte(source_address)  # type: ignore
             encoded_can_id = CanIdHandler.encode_mixed_addressed_29bit_can_id(
                 addressing_type=addressing_type,
                 target_address=target_address,  # type: ignore
@@ -4,7 +4,7 @@ __all__ = ["Normal11BitCanAddressingInformation", "NormalFixedCanAddressingInfor
 
 from typing import Optional
 
-from uds.utilities import InconsistentArgumentsError, UnusedArgumentError, validate_raw_byte
+from uds.utilities import InconsistentArgumentsError, UnusedArgumentError
 from uds.transmission_attributes import AddressingType
 from .addressing_format import CanAddressingFormat
 from .frame_fields import CanIdHandler
@@ -102,8 +102,6 @@ class NormalFixedCanAddressingInformation(AbstractCanAddressingInformation):
                                                  f"if can_id value is None for Normal Fixed Addressing Format. "
                                                  f"Actual values: "
                                                  f"target_address={target_address}, source_address={source_address}")
-            validate_raw_byte(target_address)  # type: ignore
-            validate_raw_byte(source_address)  # type: ignore
             encoded_can_id = CanIdHandler.encode_normal_fixed_addressed_can_id(
                 addressing_type=addressing_type,
                 target_address=target_address,  # type: ignore
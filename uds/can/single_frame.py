@@ -75,7 +75,7 @@ class CanSingleFrameHandler:
         sf_dl_bytes = cls.__encode_valid_sf_dl(sf_dl=len(payload),
                                                dlc=frame_dlc,
                                                addressing_format=addressing_format)
-        sf_bytes = ai_data_bytes + sf_dl_bytes + list(payload)
+        sf_bytes = [*ai_data_bytes, *sf_dl_bytes, *payload]
         if len(sf_bytes) > frame_data_bytes_number:
             raise InconsistentArgumentsError("Provided value of `payload` contains of too many bytes to fit in. "
                                              "Consider increasing DLC value.")
@@ -84,7 +84,7 @@ class CanSingleFrameHandler:
             if dlc is not None and dlc < CanDlcHandler.MIN_BASE_UDS_DLC:
                 raise InconsistentArgumentsError(f"CAN Frame Data Padding shall not be used for CAN frames with "
                                                  f"DLC < {CanDlcHandler.MIN_BASE_UDS_DLC}. Actual value: dlc={dlc}")
-            return sf_bytes + data_bytes_to_pad * [filler_byte]
+            sf_bytes.extend(data_bytes_to_pad * [filler_byte])
         return sf_bytes
 
     @classmethod
@@ -130,12 +130,12 @@ class CanSingleFrameHandler:
         frame_data_bytes_number = CanDlcHandler.decode_dlc(dlc)
         sf_dl_bytes = cls.__encode_any_sf_dl(sf_dl_short=sf_dl_short,
                                              sf_dl_long=sf_dl_long)
-        sf_bytes = ai_data_bytes + sf_dl_bytes + list(payload)
+        sf_bytes = [*ai_data_bytes, *sf_dl_bytes, *payload]
         if len(sf_bytes) > frame_data_bytes_number:
             raise InconsistentArgumentsError("Provided value of `payload` contains of too many bytes to fit in. "
                                              "Consider increasing DLC value.")
-        data_padding = ((frame_data_bytes_number - len(sf_bytes)) * [filler_byte])
-        return sf_bytes + data_padding
+        sf_bytes.extend((frame_data_bytes_number - len(sf_bytes)) * [filler_byte])
+        return sf_bytes
 
     @classmethod
     def is_single_frame(cls, addressing_format: CanAddressingFormat, raw_frame_data: RawBytesAlias) -> bool:
@@ -386,9 +386,10 @@ class CanSingleFrameHandler:
         :return: Single Frame data bytes containing CAN Packet Type and Single Frame Data Length parameters.
         """
         cls.validate_sf_dl(sf_dl=sf_dl, dlc=dlc, addressing_format=addressing_format)
+        # SF_DL value is already validated, so data bytes are built directly (without repeated validation)
         if dlc <= cls.MAX_DLC_VALUE_SHORT_SF_DL:
-            return cls.__encode_any_sf_dl(sf_dl_short=sf_dl)
-        return cls.__encode_any_sf_dl(sf_dl_long=sf_dl)
+            return [(cls.SINGLE_FRAME_N_PCI << 4) ^ sf_dl]
+        return [cls.SINGLE_FRAME_N_PCI << 4, sf_dl]
 
     @classmethod
     def __encode_any_sf_dl(cls, sf_dl_short: int = 0, sf_dl_long: Optional[int] = None) -> RawBytesListAlias:
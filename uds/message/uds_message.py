@@ -57,8 +57,8 @@ class UdsMessage(AbstractUdsMessageContainer):
         :param payload: Raw payload bytes carried by this diagnostic message.
         :param addressing_type: Addressing for which this diagnostic message is relevant.
         """
-        self.payload = payload  # type: ignore
-        self.addressing_type = addressing_type
+        self.__set_payload(payload)
+        self.__set_addressing_type(addressing_type)
 
     def __eq__(self, other: object) -> bool:
         """
@@ -84,8 +84,7 @@ class UdsMessage(AbstractUdsMessageContainer):
 
         :param value: Payload value to set.
         """
-        validate_raw_bytes(value)
-        self.__payload = tuple(value)
+        self.__set_payload(value)
 
     @property
     def addressing_type(self) -> AddressingType:
@@ -97,6 +96,23 @@ class UdsMessage(AbstractUdsMessageContainer):
         """
         Set value of addressing for this diagnostic message.
 
+        :param value: Addressing value to set.
+        """
+        self.__set_addressing_type(value)
+
+    def __set_payload(self, value: RawBytesAlias) -> None:
+        """
+        Validate and store value of raw payload bytes.
+
+        :param value: Payload value to set.
+        """
+        validate_raw_bytes(value)
+        self.__payload = tuple(value)
+
+    def __set_addressing_type(self, value: AddressingType) -> None:
+        """
+        Validate and store value of addressing.
+
         :param value: Addressing value to set.
         """
         self.__addressing_type = AddressingType.validate_member(value)
@@ -112,7 +128,8 @@ class UdsMessageRecord(AbstractUdsMessageContainer):
         :param packets_records: Sequence (in transmission order) of UDS packets records that carried this
             diagnostic message.
         """
-        self.packets_records = packets_records  # type: ignore
+        self.__validate_packets_records(packets_records)
+        self.__packets_records = tuple(packets_records)
 
     def __eq__(self, other: object) -> bool:
         """
@@ -158,23 +175,13 @@ class UdsMessageRecord(AbstractUdsMessageContainer):
     @packets_records.setter
     def packets_records(self, value: PacketsRecordsSequence):
         """
-        Assign records value of UDS Packets that carried this diagnostic message .
-
-        Provided :ref:`UDS packets <knowledge-base-uds-packet>` sequence must be a complete sequence of packets that
-        was exchanged during this diagnostic message transmission. Sequence must not contain any packets that are
-        unrelated to transmission of this message.
+        Attribute is read-only; always raises ReassignmentError.
 
-        :param value: UDS Packet Records sequence value to set.
+        :param value: Ignored.
 
-        :raise ReassignmentError: There is a call to change the value after the initial assignment (in __init__).
+        :raise ReassignmentError: Value of 'packets_records' attribute cannot be changed.
         """
-        try:
-            getattr(self, "_UdsMessageRecord__packets_records")
-        except AttributeError:
-            self.__validate_packets_records(value)
-            self.__packets_records = tuple(value)
-        else:
-            raise ReassignmentError("You cannot change value of 'packets_records' attribute once it is assigned.")
+        raise ReassignmentError("You cannot change value of 'packets_records' attribute once it is assigned.")
 
     @property
     def payload(self) -> RawBytesTupleAlias:
@@ -15,6 +15,8 @@ from .can_packet_type import CanPacketType
 class AbstractCanPacketContainer(ABC):
     """Abstract definition of CAN Packets containers."""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def raw_frame_data(self) -> RawBytesTupleAlias:
@@ -44,7 +46,7 @@ class AbstractCanPacketContainer(ABC):
     def packet_type(self) -> CanPacketType:
         """Type (N_PCI value) of this CAN packet."""
         ai_data_bytes_number = CanAddressingInformation.get_ai_data_bytes_number(self.addressing_format)
-        return CanPacketType(self.raw_frame_data[ai_data_bytes_number] >> 4)
+        return CanPacketType.validate_member(self.raw_frame_data[ai_data_bytes_number] >> 4)
 
     @property
     def target_address(self) -> Optional[int]:
@@ -100,10 +102,11 @@ class AbstractCanPacketContainer(ABC):
 
         None in other cases.
         """
-        if self.packet_type == CanPacketType.SINGLE_FRAME:
+        packet_type = self.packet_type
+        if packet_type == CanPacketType.SINGLE_FRAME:
             return CanSingleFrameHandler.decode_sf_dl(addressing_format=self.addressing_format,
                                                       raw_frame_data=self.raw_frame_data)
-        if self.packet_type == CanPacketType.FIRST_FRAME:
+        if packet_type == CanPacketType.FIRST_FRAME:
             return CanFirstFrameHandler.decode_ff_dl(addressing_format=self.addressing_format,
                                                      raw_frame_data=self.raw_frame_data)
         return None
@@ -141,13 +144,14 @@ class AbstractCanPacketContainer(ABC):
             The presence of filler bytes in :ref:`Consecutive Frame <knowledge-base-can-consecutive-frame>`
             cannot be determined basing solely on the information contained in this packet object.
         """
-        if self.packet_type == CanPacketType.SINGLE_FRAME:
+        packet_type = self.packet_type
+        if packet_type == CanPacketType.SINGLE_FRAME:
             return tuple(CanSingleFrameHandler.decode_payload(addressing_format=self.addressing_format,
                                                               raw_frame_data=self.raw_frame_data))
-        if self.packet_type == CanPacketType.FIRST_FRAME:
+        if packet_type == CanPacketType.FIRST_FRAME:
             return tuple(CanFirstFrameHandler.decode_payload(addressing_format=self.addressing_format,
                                                              raw_frame_data=self.raw_frame_data))
-        if self.packet_type == CanPacketType.CONSECUTIVE_FRAME:
+        if packet_type == CanPacketType.CONSECUTIVE_FRAME:
             return tuple(CanConsecutiveFrameHandler.decode_payload(addressing_format=self.addressing_format,
                                                                    raw_frame_data=self.raw_frame_data))
         return None
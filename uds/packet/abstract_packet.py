@@ -16,6 +16,8 @@ from .abstract_packet_type import AbstractUdsPacketType
 class AbstractUdsPacketContainer(ABC):
     """Abstract definition of a container with UDS Packet information."""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def raw_frame_data(self) -> RawBytesTupleAlias:
@@ -45,6 +47,8 @@ class AbstractUdsPacketContainer(ABC):
 class AbstractUdsPacket(AbstractUdsPacketContainer):
     """Abstract definition of UDS Packet (Network Protocol Data Unit - N_PDU)."""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def raw_frame_data(self) -> RawBytesTupleAlias:
@@ -74,6 +78,10 @@ class AbstractUdsPacket(AbstractUdsPacketContainer):
 class AbstractUdsPacketRecord(AbstractUdsPacketContainer):
     """Abstract definition of a storage for historic information about transmitted or received UDS Packet."""
 
+    __slots__ = ("__frame",
+                 "__direction",
+                 "__transmission_time")
+
     @abstractmethod
     def __init__(self,
                  frame: Any,
@@ -85,10 +93,15 @@ class AbstractUdsPacketRecord(AbstractUdsPacketContainer):
         :param frame: Frame that carried this UDS packet.
         :param direction: Information whether this packet was transmitted or received.
         :param transmission_time: Time stamp when this packet was fully transmitted on a bus.
+
+        :raise TypeError: Provided value of transmission time has unexpected type.
         """
-        self.frame = frame
-        self.direction = direction
-        self.transmission_time = transmission_time
+        self._validate_frame(frame)
+        if not isinstance(transmission_time, datetime):
+            raise TypeError(f"Provided value has invalid type: {type(transmission_time)}")
+        self.__frame = frame
+        self.__direction = TransmissionDirection.validate_member(direction)
+        self.__transmission_time = transmission_time
 
     @property
     def frame(self) -> Any:
@@ -96,21 +109,15 @@ class AbstractUdsPacketRecord(AbstractUdsPacketContainer):
         return self.__frame
 
     @frame.setter
-    def frame(self, value: Any):
+    def frame(self, value: Any) -> None:
         """
-        Set value of frame attribute.
+        Attribute is read-only; always raises ReassignmentError.
 
-        :param value: Frame value to set.
+        :param value: Ignored.
 
-        :raise ReassignmentError: There is a call to change the value after the initial assignment (in __init__).
+        :raise ReassignmentError: Value of 'frame' attribute cannot be changed.
         """
-        try:
-            getattr(self, "_AbstractUdsPacketRecord__frame")
-        except AttributeError:
-            self._validate_frame(value)
-            self.__frame = value
-        else:
-            raise ReassignmentError("You cannot change value of 'frame' attribute once it is assigned.")
+        raise ReassignmentError("You cannot change value of 'frame' attribute once it is assigned.")
 
     @property
     def direction(self) -> TransmissionDirection:
@@ -118,20 +125,15 @@ class AbstractUdsPacketRecord(AbstractUdsPacketContainer):
         return self.__direction
 
     @direction.setter
-    def direction(self, value: TransmissionDirection):
+    def direction(self, value: TransmissionDirection) -> None:
         """
-        Set value of direction attribute.
+        Attribute is read-only; always raises ReassignmentError.
 
-        :param value: Direction value to set.
+        :param value: Ignored.
 
-        :raise ReassignmentError: There is a call to change the value after the initial assignment (in __init__).
+        :raise ReassignmentError: Value of 'direction' attribute cannot be changed.
         """
-        try:
-            getattr(self, "_AbstractUdsPacketRecord__direction")
-        except AttributeError:
-            self.__direction = TransmissionDirection.validate_member(value)
-        else:
-            raise ReassignmentError("You cannot change value of 'direction' attribute once it is assigned.")
+        raise ReassignmentError("You cannot change value of 'direction' attribute once it is assigned.")
 
     @property
     def transmission_time(self) -> datetime:
@@ -139,23 +141,15 @@ class AbstractUdsPacketRecord(AbstractUdsPacketContainer):
         return self.__transmission_time
 
     @transmission_time.setter
-    def transmission_time(self, value: datetime):
+    def transmission_time(self, value: datetime) -> None:
         """
-        Set value when this packet was transmitted on a bus.
+        Attribute is read-only; always raises ReassignmentError.
 
-        :param value: Value of transmission time to set.
+        :param value: Ignored.
 
-        :raise TypeError: Provided value has unexpected type.
-        :raise ReassignmentError: There is a call to change the value after the initial assignment (in __init__).
+        :raise ReassignmentError: Value of 'transmission_time' attribute cannot be changed.
         """
-        try:
-            getattr(self, "_AbstractUdsPacketRecord__transmission_time")
-        except AttributeError:
-            if not isinstance(value, datetime):
-                raise TypeError(f"Provided value has invalid type: {type(value)}")  # pylint: disable=raise-missing-from
-            self.__transmission_time = value
-        else:
-            raise ReassignmentError("You cannot change value of 'transmission_time' attribute once it is assigned.")
+        raise ReassignmentError("You cannot change value of 'transmission_time' attribute once it is assigned.")
 
     @property
     @abstractmethod
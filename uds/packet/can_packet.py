@@ -2,7 +2,7 @@
 
 __all__ = ["CanPacket"]
 
-from typing import Optional, Any
+from typing import Optional, Any, Dict, Tuple
 from warnings import warn
 
 from uds.utilities import AmbiguityError, UnusedArgumentWarning, RawBytesAlias, RawBytesTupleAlias
@@ -26,6 +26,50 @@ class CanPacket(AbstractCanPacketContainer, AbstractUdsPacket):
     :ref:`CAN packet <knowledge-base-uds-can-packet>`.
     """
 
+    __slots__ = ("__raw_frame_data",
+                 "__addressing_type",
+                 "__addressing_format",
+                 "__packet_type",
+                 "__can_id",
+                 "__dlc",
+                 "__target_address",
+                 "__source_address",
+                 "__address_extension")
+
+    __ADDRESS_INFORMATION_SETTERS_MAPPING: Dict[CanAddressingFormat, Tuple[str, Tuple[str, ...]]] = {
+        CanAddressingFormat.NORMAL_11BIT_ADDRESSING: (
+            "set_address_information_normal_11bit",
+            (AbstractCanAddressingInformation.CAN_ID_NAME,)),
+        CanAddressingFormat.NORMAL_FIXED_ADDRESSING: (
+            "set_address_information_normal_fixed",
+            (AbstractCanAddressingInformation.CAN_ID_NAME,
+             AbstractCanAddressingInformation.TARGET_ADDRESS_NAME,
+             AbstractCanAddressingInformation.SOURCE_ADDRESS_NAME)),
+        CanAddressingFormat.EXTENDED_ADDRESSING: (
+            "set_address_information_extended",
+            (AbstractCanAddressingInformation.CAN_ID_NAME,
+             AbstractCanAddressingInformation.TARGET_ADDRESS_NAME)),
+        CanAddressingFormat.MIXED_11BIT_ADDRESSING: (
+            "set_address_information_mixed_11bit",
+            (AbstractCanAddressingInformation.CAN_ID_NAME,
+             AbstractCanAddressingInformation.ADDRESS_EXTENSION_NAME)),
+        CanAddressingFormat.MIXED_29BIT_ADDRESSING: (
+            "set_address_information_mixed_29bit",
+            (AbstractCanAddressingInformation.CAN_ID_NAME,
+             AbstractCanAddressingInformation.TARGET_ADDRESS_NAME,
+             AbstractCanAddressingInformation.SOURCE_ADDRESS_NAME,
+             AbstractCanAddressingInformation.ADDRESS_EXTENSION_NAME)),
+    }
+    """Mapping of CAN Addressing format to the name of addressing information setter and names of its parameters."""
+
+    __PACKET_DATA_SETTERS_MAPPING: Dict[CanPacketType, str] = {
+        CanPacketType.SINGLE_FRAME: "set_single_frame_data",
+        CanPacketType.FIRST_FRAME: "set_first_frame_data",
+        CanPacketType.CONSECUTIVE_FRAME: "set_consecutive_frame_data",
+        CanPacketType.FLOW_CONTROL: "set_flow_control_data",
+    }
+    """Mapping of CAN Packet Type to the name of packet data setter."""
+
     def __init__(self, *,
                  packet_type: CanPacketType,
                  addressing_format: CanAddressingFormat,
@@ -76,16 +120,16 @@ class CanPacket(AbstractCanPacketContainer, AbstractUdsPacket):
             - :parameter st_min: (required for: FC with ContinueToSend Flow Status)
                 Separation Time minimum information carried by this Flow Control frame.
         """
-        # initialize the variables
+        # initialize the variables (only these two are read before they are set)
         self.__raw_frame_data: RawBytesTupleAlias = None  # type: ignore
-        self.__addressing_type: AddressingType = None  # type: ignore
         self.__addressing_format: CanAddressingFormat = None  # type: ignore
-        self.__packet_type: CanPacketType = None  # type: ignore
-        self.__can_id: int = None  # type: ignore
-        self.__dlc: int = None  # type: ignore
-        self.__target_address: Optional[int] = None
-        self.__source_address: Optional[int] = None
-        self.__address_extension: Optional[int] = None
+        self.__addressing_type: AddressingType
+        self.__packet_type: CanPacketType
+        self.__can_id: int
+        self.__dlc: int
+        self.__target_address: Optional[int]
+        self.__source_address: Optional[int]
+        self.__address_extension: Optional[int]
         # set the proper attribute values after arguments validation
         self.set_address_information(addressing_type=addressing_type,
                                      addressing_format=addressing_format,
@@ -128,47 +172,23 @@ class CanPacket(AbstractCanPacketContainer, AbstractUdsPacket):
             with detailed description if you face this error.
         """
         CanAddressingFormat.validate_member(addressing_format)
-        if addressing_format == CanAddressingFormat.NORMAL_11BIT_ADDRESSING:
-            self.set_address_information_normal_11bit(addressing_type=addressing_type,
-                                                      can_id=can_id)  # type: ignore
-            if (target_address, source_address, address_extension) != (None, None, None):
-                warn(message=f"Unused arguments were provided to {CanPacket.set_address_information}. Expected: None."
-                             f"Actual values: target_address={target_address}, source_address={source_address}, "
-                             f"address_extension={address_extension}",
-                     category=UnusedArgumentWarning)
-        elif addressing_format == CanAddressingFormat.NORMAL_FIXED_ADDRESSING:
-            self.set_address_information_normal_fixed(addressing_type=addressing_type,
-                                                      can_id=can_id,
-                                                      target_address=target_address,
-                                                      source_address=source_address)
-            if address_extension is not None:
-                warn(message=f"Unused argument was provided to {CanPacket.set_address_information}. Expected: None."
-                             f"Actual value: address_extension={address_extension}",
-                     category=UnusedArgumentWarning)
-        elif addressing_format == CanAddressingFormat.EXTENDED_ADDRESSING:
-            self.set_address_information_extended(addressing_type=addressing_type,
-                                                  can_id=can_id,  # type: ignore
-                                                  target_address=target_address)  # type: ignore
-            if (source_address, address_extension) != (None, None):
-                warn(message=f"Unused arguments were provided to {CanPacket.set_address_information}. Expected: None."
-                             f"Actual values: source_address={source_address}, address_extension={address_extension}",
-                     category=UnusedArgumentWarning)
-        elif addressing_format == CanAddressingFormat.MIXED_11BIT_ADDRESSING:
-            self.set_address_information_mixed_11bit(addressing_type=addressing_type,
-                                                     can_id=can_id,  # type: ignore
-                                                     address_extension=address_extension)  # type: ignore
-            if (target_address, source_address) != (None, None):
-                warn(message=f"Unused arguments were provided to {CanPacket.set_address_information}. Expected: None."
-                             f"Actual values: target_address={target_address}, source_address={source_address}, ",
-                     category=UnusedArgumentWarning)
-        elif addressing_format == CanAddressingFormat.MIXED_29BIT_ADDRESSING:
-            self.set_address_information_mixed_29bit(addressing_type=addressing_type,
-                                                     can_id=can_id,
-                                                     target_address=target_address,
-                                                     source_address=source_address,
-                                                     address_extension=address_extension)  # type: ignore
-        else:
+        try:
+            setter_name, used_params_names = CanPacket.__ADDRESS_INFORMATION_SETTERS_MAPPING[addressing_format]
+        except KeyError:
+            # pylint: disable=raise-missing-from
             raise NotImplementedError(f"Missing implementation for: {addressing_format}")
+        ai_params = {AbstractCanAddressingInformation.CAN_ID_NAME: can_id,
+                     AbstractCanAddressingInformation.TARGET_ADDRESS_NAME: target_address,
+                     AbstractCanAddressingInformation.SOURCE_ADDRESS_NAME: source_address,
+                     AbstractCanAddressingInformation.ADDRESS_EXTENSION_NAME: address_extension}
+        getattr(self, setter_name)(addressing_type=addressing_type,
+                                   **{param_name: ai_params[param_name] for param_name in used_params_names})
+        unused_params = {param_name: value for param_name, value in ai_params.items()
+                         if value is not None and param_name not in used_params_names}
+        if unused_params:
+            warn(message=f"Unused arguments were provided to {CanPacket.set_address_information}. Expected: None. "
+                         f"Actual values: {unused_params}",
+                 category=UnusedArgumentWarning)
 
     def set_address_information_normal_11bit(self, addressing_type: AddressingType, can_id: int) -> None:
         """
@@ -177,10 +197,12 @@ class CanPacket(AbstractCanPacketContainer, AbstractUdsPacket):
         :param addressing_type: Addressing type for which this CAN packet is relevant.
         :param can_id: CAN Identifier value that is used by this packet.
         """
-        Normal11BitCanAddressingInformation.validate_packet_ai(addressing_type=addressing_type, can_id=can_id)
-        self.__validate_unambiguous_ai_change(CanAddressingFormat.NORMAL_11BIT_ADDRESSING)
+        ai_params = Normal11BitCanAddressingInformation.validate_packet_ai(addressing_type=addressing_type,
+                                                                           can_id=can_id)
+        if self.__addressing_format is not None:
+            self.__validate_unambiguous_ai_change(CanAddressingFormat.NORMAL_11BIT_ADDRESSING)
         self.__addressing_format = CanAddressingFormat.NORMAL_11BIT_ADDRESSING
-        self.__addressing_type = AddressingType(addressing_type)
+        self.__addressing_type = ai_params[AbstractCanAddressingInformation.ADDRESSING_TYPE_NAME]  # type: ignore
         self.__can_id = can_id
         self.__target_address = None
         self.__source_address = None
@@ -207,12 +229,13 @@ class CanPacket(AbstractCanPacketContainer, AbstractUdsPacket):
                                                                            can_id=can_id,
                                                                            target_address=target_address,
                                                                            source_address=source_address)
-        self.__validate_unambiguous_ai_change(CanAddressingFormat.NORMAL_FIXED_ADDRESSING)
+        if self.__addressing_format is not None:
+            self.__validate_unambiguous_ai_change(CanAddressingFormat.NORMAL_FIXED_ADDRESSING)
         self.__can_id = ai_params[AbstractCanAddressingInformation.CAN_ID_NAME]  # type: ignore
         self.__source_address = ai_params[AbstractCanAddressingInformation.SOURCE_ADDRESS_NAME]  # type: ignore
         self.__target_address = ai_params[AbstractCanAddressingInformation.TARGET_ADDRESS_NAME]  # type: ignore
         self.__addressing_format = CanAddressingFormat.NORMAL_FIXED_ADDRESSING
-        self.__addressing_type = AddressingType(addressing_type)
+        self.__addressing_type = ai_params[AbstractCanAddressingInformation.ADDRESSING_TYPE_NAME]  # type: ignore
         self.__address_extension = None
         self.__update_ai_data_byte()
 
@@ -227,12 +250,13 @@ class CanPacket(AbstractCanPacketContainer, AbstractUdsPacket):
         :param can_id: CAN Identifier value that is used by this packet.
         :param target_address: Target Address value carried by this CAN Packet.
         """
-        ExtendedCanAddressingInformation.validate_packet_ai(addressing_type=addressing_type,
-                                                            can_id=can_id,
-                                                            target_address=target_address)
-        self.__validate_unambiguous_ai_change(CanAddressingFormat.EXTENDED_ADDRESSING)
+        ai_params = ExtendedCanAddressingInformation.validate_packet_ai(addressing_type=addressing_type,
+                                                                        can_id=can_id,
+                                                                        target_address=target_address)
+        if self.__addressing_format is not None:
+            self.__validate_unambiguous_ai_change(CanAddressingFormat.EXTENDED_ADDRESSING)
         self.__addressing_format = CanAddressingFormat.EXTENDED_ADDRESSING
-        self.__addressing_type = AddressingType(addressing_type)
+        self.__addressing_type = ai_params[AbstractCanAddressingInformation.ADDRESSING_TYPE_NAME]  # type: ignore
         self.__can_id = can_id
         self.__target_address = target_address
         self.__source_address = None
@@ -250,12 +274,13 @@ class CanPacket(AbstractCanPacketContainer, AbstractUdsPacket):
         :param can_id: CAN Identifier value that is used by this packet.
         :param address_extension: Address Extension value carried by this CAN packet.
         """
-        Mixed11BitCanAddressingInformation.validate_packet_ai(addressing_type=addressing_type,
-                                                              can_id=can_id,
-                                                              address_extension=address_extension)
-        self.__validate_unambiguous_ai_change(CanAddressingFormat.MIXED_11BIT_ADDRESSING)
+        ai_params = Mixed11BitCanAddressingInformation.validate_packet_ai(addressing_type=addressing_type,
+                                                                          can_id=can_id,
+                                                                          address_extension=address_extension)
+        if self.__addressing_format is not None:
+            self.__validate_unambiguous_ai_change(CanAddressingFormat.MIXED_11BIT_ADDRESSING)
         self.__addressing_format = CanAddressingFormat.MIXED_11BIT_ADDRESSING
-        self.__addressing_type = AddressingType(addressing_type)
+        self.__addressing_type = ai_params[AbstractCanAddressingInformation.ADDRESSING_TYPE_NAME]  # type: ignore
         self.__can_id = can_id
         self.__target_address = None
         self.__source_address = None
@@ -285,12 +310,13 @@ class CanPacket(AbstractCanPacketContainer, AbstractUdsPacket):
                                                                           target_address=target_address,
                                                                           source_address=source_address,
                                                                           address_extension=address_extension)
-        self.__validate_unambiguous_ai_change(CanAddressingFormat.MIXED_29BIT_ADDRESSING)
+        if self.__addressing_format is not None:
+            self.__validate_unambiguous_ai_change(CanAddressingFormat.MIXED_29BIT_ADDRESSING)
         self.__can_id = ai_params[AbstractCanAddressingInformation.CAN_ID_NAME]  # type: ignore
         self.__source_address = ai_params[AbstractCanAddressingInformation.SOURCE_ADDRESS_NAME]  # type: ignore
         self.__target_address = ai_params[AbstractCanAddressingInformation.TARGET_ADDRESS_NAME]  # type: ignore
         self.__addressing_format = CanAddressingFormat.MIXED_29BIT_ADDRESSING
-        self.__addressing_type = AddressingType(addressing_type)
+        self.__addressing_type = ai_params[AbstractCanAddressingInformation.ADDRESSING_TYPE_NAME]  # type: ignore
         self.__address_extension = address_extension
         self.__update_ai_data_byte()
 
@@ -335,16 +361,12 @@ class CanPacket(AbstractCanPacketContainer, AbstractUdsPacket):
             with detailed description if you face this error.
         """
         CanPacketType.validate_member(packet_type)
-        if packet_type == CanPacketType.SINGLE_FRAME:
-            self.set_single_frame_data(dlc=dlc, **packet_type_specific_kwargs)
-        elif packet_type == CanPacketType.FIRST_FRAME:
-            self.set_first_frame_data(dlc=dlc, **packet_type_specific_kwargs)  # type: ignore
-        elif packet_type == CanPacketType.CONSECUTIVE_FRAME:
-            self.set_consecutive_frame_data(dlc=dlc, **packet_type_specific_kwargs)
-        elif packet_type == CanPacketType.FLOW_CONTROL:
-            self.set_flow_control_data(dlc=dlc, **packet_type_specific_kwargs)
-        else:
+        try:
+            setter_name = CanPacket.__PACKET_DATA_SETTERS_MAPPING[packet_type]
+        except KeyError:
+            # pylint: disable=raise-missing-from
             raise NotImplementedError(f"Missing implementation for: {packet_type}")
+        getattr(self, setter_name)(dlc=dlc, **packet_type_specific_kwargs)
 
     def set_single_frame_data(self,
                               payload: RawBytesAlias,
@@ -365,9 +387,9 @@ class CanPacket(AbstractCanPacketContainer, AbstractUdsPacket):
 
         :param filler_byte: Filler Byte value to use for CAN Frame Data Padding.
         """
-        raw_frame_data = CanSingleFrameHandler.create_valid_frame_data(addressing_format=self.addressing_format,
-                                                                       target_address=self.target_address,
-                                                                       address_extension=self.address_extension,
+        raw_frame_data = CanSingleFrameHandler.create_valid_frame_data(addressing_format=self.__addressing_format,
+                                                                       target_address=self.__target_address,
+                                                                       address_extension=self.__address_extension,
                                                                        dlc=dlc,
                                                                        payload=payload,
                                                                        filler_byte=filler_byte)
@@ -390,9 +412,9 @@ class CanPacket(AbstractCanPacketContainer, AbstractUdsPacket):
         :param payload: Payload of a diagnostic message that is carried by this CAN packet.
         :param data_length: Number of payload bytes of a diagnostic message initiated by this First Frame packet.
         """
-        raw_frame_data = CanFirstFrameHandler.create_valid_frame_data(addressing_format=self.addressing_format,
-                                                                      target_address=self.target_address,
-                                                                      address_extension=self.address_extension,
+        raw_frame_data = CanFirstFrameHandler.create_valid_frame_data(addressing_format=self.__addressing_format,
+                                                                      target_address=self.__target_address,
+                                                                      address_extension=self.__address_extension,
                                                                       dlc=dlc,
                                                                       payload=payload,
                                                                       ff_dl=data_length)
@@ -421,9 +443,9 @@ class CanPacket(AbstractCanPacketContainer, AbstractUdsPacket):
 
         :param filler_byte: Filler Byte value to use for CAN Frame Data Padding.
         """
-        raw_frame_data = CanConsecutiveFrameHandler.create_valid_frame_data(addressing_format=self.addressing_format,
-                                                                            target_address=self.target_address,
-                                                                            address_extension=self.address_extension,
+        raw_frame_data = CanConsecutiveFrameHandler.create_valid_frame_data(addressing_format=self.__addressing_format,
+                                                                            target_address=self.__target_address,
+                                                                            address_extension=self.__address_extension,
                                                                             dlc=dlc,
                                                                             payload=payload,
                                                                             sequence_number=sequence_number,
@@ -455,9 +477,9 @@ class CanPacket(AbstractCanPacketContainer, AbstractUdsPacket):
 
         :param filler_byte: Filler Byte value to use for CAN Frame Data Padding.
         """
-        raw_frame_data = CanFlowControlHandler.create_valid_frame_data(addressing_format=self.addressing_format,
-                                                                       target_address=self.target_address,
-                                                                       address_extension=self.address_extension,
+        raw_frame_data = CanFlowControlHandler.create_valid_frame_data(addressing_format=self.__addressing_format,
+                                                                       target_address=self.__target_address,
+                                                                       address_extension=self.__address_extension,
                                                                        dlc=dlc,
                                                                        flow_status=flow_status,
                                                                        block_size=block_size,
@@ -544,19 +566,21 @@ class CanPacket(AbstractCanPacketContainer, AbstractUdsPacket):
 
         :param addressing_format: Desired value of CAN Addressing Format.
 
+        .. note:: Call it only when CAN Addressing Format was already set (not during the packet creation).
+
         :raise AmbiguityError: Cannot change value because the operation is ambiguous.
         """
-        if self.addressing_format is not None \
+        if addressing_format is not self.__addressing_format \
                 and CanAddressingInformation.get_ai_data_bytes_number(addressing_format) \
-                != CanAddressingInformation.get_ai_data_bytes_number(self.addressing_format):
-            raise AmbiguityError(f"Cannot change CAN Addressing Format from {self.addressing_format} to "
+                != CanAddressingInformation.get_ai_data_bytes_number(self.__addressing_format):
+            raise AmbiguityError(f"Cannot change CAN Addressing Format from {self.__addressing_format} to "
                                  f"{addressing_format} as such operation provides ambiguity. "
                                  f"Create a new CAN Packet object instead.")
 
     def __update_ai_data_byte(self) -> None:
         """Update the value of `raw_frame_data` attribute after Addressing Information change."""
         if self.__raw_frame_data is not None:
-            ai_data_bytes = CanAddressingInformation.encode_ai_data_bytes(addressing_format=self.addressing_format,
-                                                                          target_address=self.target_address,
-                                                                          address_extension=self.address_extension)
-            self.__raw_frame_data = tuple(ai_data_bytes + list(self.__raw_frame_data[len(ai_data_bytes):]))
+            ai_data_bytes = CanAddressingInformation.encode_ai_data_bytes(addressing_format=self.__addressing_format,
+                                                                          target_address=self.__target_address,
+                                                                          address_extension=self.__address_extension)
+            self.__raw_frame_data = (*ai_data_bytes, *self.__raw_frame_data[len(ai_data_bytes):])
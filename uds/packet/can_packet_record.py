@@ -2,7 +2,7 @@
 
 __all__ = ["CanPacketRecord"]
 
-from typing import Union, Any, Optional
+from typing import Union, Any, Optional, Sequence, List
 from datetime import datetime
 
 from can import Message as PythonCanMessage
@@ -29,6 +29,15 @@ class CanPacketRecord(AbstractCanPacketContainer, AbstractUdsPacketRecord):
     :ref:`CAN packet <knowledge-base-uds-can-packet>`.
     """
 
+    __slots__ = ("__raw_frame_data",
+                 "__dlc",
+                 "__addressing_type",
+                 "__addressing_format",
+                 "__packet_type",
+                 "__target_address",
+                 "__source_address",
+                 "__address_extension")
+
     def __init__(self,
                  frame: CanFrameAlias,
                  direction: TransmissionDirection,
@@ -45,28 +54,86 @@ class CanPacketRecord(AbstractCanPacketContainer, AbstractUdsPacketRecord):
         :param transmission_time: Time stamp when this packet was fully transmitted on a CAN bus.
         """
         super().__init__(frame=frame, direction=direction, transmission_time=transmission_time)
+        self.__raw_frame_data = self.__extract_raw_frame_data(frame)
+        self.__dlc = CanDlcHandler.encode_dlc(len(self.__raw_frame_data))
         self.__addressing_type = AddressingType.validate_member(addressing_type)
         self.__addressing_format = CanAddressingFormat.validate_member(addressing_format)
-        self.__packet_type: CanPacketType
+        ai_data_bytes_number = CanAddressingInformation.get_ai_data_bytes_number(self.__addressing_format)
+        self.__packet_type = CanPacketType.validate_member(self.__raw_frame_data[ai_data_bytes_number] >> 4)
         self.__target_address: Optional[int]
         self.__source_address: Optional[int]
         self.__address_extension: Optional[int]
-        self.__assess_packet_type()
-        self.__assess_ai_attributes()
+        self.__assess_ai_attributes(ai_data_bytes_number)
+
+    @classmethod
+    def from_frames(cls,
+                    frames: Sequence[CanFrameAlias],
+                    direction: TransmissionDirection,
+                    addressing_type: AddressingType,
+                    addressing_format: CanAddressingFormat,
+                    transmission_times: Sequence[datetime]) -> List["CanPacketRecord"]:
+        """
+        Create records of CAN packets that were carried by multiple CAN frames.
+
+        Attributes that are common for all the records are validated before any record is created,
+        so invalid arguments are reported without processing any frame.
+
+        :param frames: CAN frames that carried CAN packets.
+        :param direction: Information whether these packets were transmitted or received.
+        :param addressing_type: Addressing type for which these CAN packets are relevant.
+        :param addressing_format: CAN addressing format that these CAN packets used.
+        :param transmission_times: Time stamps when these packets were fully transmitted on a CAN bus.
+            Values must be provided in the same order as frames.
+
+        :raise InconsistentArgumentsError: Numbers of provided frames and transmission times are not equal.
+
+        :return: Records of CAN packets (in the same order as provided frames).
+        """
+        if len(frames) != len(transmission_times):
+            raise InconsistentArgumentsError("Number of transmission times does not match number of frames.")
+        direction = TransmissionDirection.validate_member(direction)
+        addressing_type = AddressingType.validate_member(addressing_type)
+        addressing_format = CanAddressingFormat.validate_member(addressing_format)
+        return [cls(frame=frame,
+                    direction=direction,
+                    addressing_type=addressing_type,
+                    addressing_format=addressing_format,
+                    transmission_time=transmission_time)
+                for frame, transmission_time in zip(frames, transmission_times)]
+
+    def __str__(self) -> str:
+        """Present object in string format."""
+        return (f"{self.__class__.__name__}("
+                f"direction={self.direction}, "
+                f"packet_type={self.packet_type}, "
+                f"raw_frame_data={self.raw_frame_data}, "
+                f"can_id={self.can_id}, "
+                f"dlc={self.dlc}, "
+                f"addressing_format={self.addressing_format}, "
+                f"addressing_type={self.addressing_type}, "
+                f"target_address={self.target_address}, "
+                f"source_address={self.source_address}, "
+                f"address_extension={self.address_extension}, "
+                f"transmission_time={self.transmission_time}, "
+                f"frame={self.frame})")
 
     @property
     def raw_frame_data(self) -> RawBytesTupleAlias:
         """Raw data bytes of a frame that carried this CAN packet."""
-        if isinstance(self.frame, PythonCanMessage):
-            return tuple(self.frame.data)
-        raise NotImplementedError(f"Missing implementation for: {self.frame}")
+        return self.__raw_frame_data
+
+    @property
+    def dlc(self) -> int:
+        """Value of Data Length Code (DLC) of a CAN Frame that carried this CAN packet."""
+        return self.__dlc
 
     @property
     def can_id(self) -> int:
         """CAN Identifier (CAN ID) of a CAN Frame that carries this CAN packet."""
-        if isinstance(self.frame, PythonCanMessage):
-            return self.frame.arbitration_id
-        raise NotImplementedError(f"Missing implementation for: {self.frame}")
+        frame = self.frame
+        if isinstance(frame, PythonCanMessage):
+            return frame.arbitration_id
+        raise NotImplementedError(f"Missing implementation for: {frame}")
 
     @property
     def addressing_format(self) -> CanAddressingFormat:
@@ -140,25 +207,35 @@ class CanPacketRecord(AbstractCanPacketContainer, AbstractUdsPacketRecord):
             return None
         raise TypeError(f"Unsupported CAN Frame type was provided. Actual type: {type(value)}")
 
-    def __assess_packet_type(self) -> None:
-        """Assess and set value of Packet Type attribute."""
-        ai_data_bytes = CanAddressingInformation.get_ai_data_bytes_number(self.addressing_format)
-        n_pci_value = self.raw_frame_data[ai_data_bytes] >> 4
-        self.__packet_type = CanPacketType.validate_member(n_pci_value)
+    @staticmethod
+    def __extract_raw_frame_data(frame: CanFrameAlias) -> RawBytesTupleAlias:
+        """
+        Extract raw data bytes of a CAN frame.
+
+        :param frame: CAN frame to extract data bytes from.
 
-    def __assess_ai_attributes(self) -> None:
+        :raise NotImplementedError: There is missing implementation for the provided frame type.
+
+        :return: Raw data bytes carried by the frame.
+        """
+        if isinstance(frame, PythonCanMessage):
+            return tuple(frame.data)
+        raise NotImplementedError(f"Missing implementation for: {frame}")
+
+    def __assess_ai_attributes(self, ai_data_bytes_number: int) -> None:
         """
         Assess and set values of attributes with Addressing Information.
 
+        :param ai_data_bytes_number: Number of CAN frame data bytes that are used by the addressing format.
+
         :raise InconsistentArgumentsError: Value of Addressing Type that is already set does not match decoded one.
         """
-        ai_data_bytes_number = CanAddressingInformation.get_ai_data_bytes_number(self.addressing_format)
-        ai_info = CanAddressingInformation.decode_packet_ai(addressing_format=self.addressing_format,
+        ai_info = CanAddressingInformation.decode_packet_ai(addressing_format=self.__addressing_format,
                                                             can_id=self.can_id,
-                                                            ai_data_bytes=self.raw_frame_data[:ai_data_bytes_number])
+                                                            ai_data_bytes=self.__raw_frame_data[:ai_data_bytes_number])
         self.__target_address = ai_info[AbstractCanAddressingInformation.TARGET_ADDRESS_NAME]  # type: ignore
         self.__source_address = ai_info[AbstractCanAddressingInformation.SOURCE_ADDRESS_NAME]  # type: ignore
         self.__address_extension = ai_info[AbstractCanAddressingInformation.ADDRESS_EXTENSION_NAME]  # type: ignore
         _addressing_type = ai_info[AbstractCanAddressingInformation.ADDRESSING_TYPE_NAME]  # type: ignore
-        if _addressing_type not in (self.addressing_type, None):  # type: ignore
+        if _addressing_type not in (self.__addressing_type, None):  # type: ignore
             raise InconsistentArgumentsError("Decoded Addressing Type does not match the one that is already set.")
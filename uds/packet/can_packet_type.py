@@ -2,9 +2,13 @@
 
 __all__ = ["CanPacketType"]
 
+from typing import Iterable, List
+
 from aenum import unique
 
-from uds.can import CanSingleFrameHandler, CanFirstFrameHandler, CanConsecutiveFrameHandler, CanFlowControlHandler
+from uds.utilities import RawBytesAlias
+from uds.can import CanAddressingFormat, CanAddressingInformation, \
+    CanSingleFrameHandler, CanFirstFrameHandler, CanConsecutiveFrameHandler, CanFlowControlHandler
 from .abstract_packet_type import AbstractUdsPacketType
 
 
@@ -36,3 +40,24 @@ class CanPacketType(AbstractUdsPacketType):
         :return: True if given argument is a packet type that initiates a diagnostic message, else False.
         """
         return cls.validate_member(value) in (cls.SINGLE_FRAME, cls.FIRST_FRAME)
+
+    @classmethod
+    def decode_packet_types(cls,
+                            addressing_format: CanAddressingFormat,
+                            raw_frames_data: Iterable[RawBytesAlias]) -> List["CanPacketType"]:
+        """
+        Extract CAN packet types from data bytes of multiple CAN frames.
+
+        This is a bulk alternative to creating a packet record for each frame, when only packet types are needed
+        (e.g. for filtering a recorded bus trace). Data bytes are not validated.
+
+        :param addressing_format: CAN addressing format used by all the frames.
+        :param raw_frames_data: Sequence with raw data bytes of CAN frames.
+
+        :raise IndexError: At least one frame carries fewer data bytes than Addressing Information and N_PCI need.
+        :raise ValueError: At least one frame carries N_PCI value that is not a CAN packet type.
+
+        :return: CAN packet types (in the same order as provided frames data).
+        """
+        ai_data_bytes_number = CanAddressingInformation.get_ai_data_bytes_number(addressing_format)
+        return [cls.validate_member(raw_frame_data[ai_data_bytes_number] >> 4) for raw_frame_data in raw_frames_data]
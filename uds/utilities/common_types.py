@@ -48,20 +48,30 @@ def validate_raw_byte(value: int) -> None:
         raise ValueError(f"Provided value is out of byte values range (0x00-0xFF). Actual value: {value}")
 
 
-def validate_raw_bytes(value: RawBytesAlias, allow_empty: bool = False) -> None:
+def validate_raw_bytes(value: Union[RawBytesAlias, bytes], allow_empty: bool = False) -> None:
     """
     Validate whether provided value stores raw bytes value.
 
     :param value: Value to validate.
     :param allow_empty: True if empty list is allowed, False otherwise.
 
-    :raise TypeError: Value is not tuple or list type.
+    :raise TypeError: Value is not tuple, list, bytes or bytearray type.
     :raise ValueError: Value does not contain raw bytes (int value between 0x00-0xFF) only.
     """
-    if not isinstance(value, (tuple, list, bytearray)):
-        raise TypeError(f"Provided value is not list or tuple type. Actual type: {type(value)}")
+    if not isinstance(value, (tuple, list, bytes, bytearray)):
+        raise TypeError(f"Provided value is not list, tuple, bytes or bytearray type. Actual type: {type(value)}")
     if not allow_empty and not value:
         raise ValueError("Provided values is empty sequence.")
-    if not all(isinstance(raw_byte, int) and 0x00 <= raw_byte <= 0xFF for raw_byte in value):
+    if isinstance(value, (bytes, bytearray)):
+        return  # each element of bytes and bytearray is a raw byte by definition
+    # two passes: bytes() checks ranges of all elements in C, then a Python level loop checks their types
+    # (bytes() alone would also accept any object that defines __index__)
+    try:
+        bytes(value)
+    except (TypeError, ValueError):
+        # pylint: disable=raise-missing-from
+        raise ValueError(f"Provided value does not contain raw bytes (int value between 0x00 and 0xFF) only. "
+                         f"Actual value: {value}")
+    if not all(isinstance(raw_byte, int) for raw_byte in value):
         raise ValueError(f"Provided value does not contain raw bytes (int value between 0x00 and 0xFF) only. "
                          f"Actual value: {value}")
@@ -65,6 +65,12 @@ class ValidatedEnum(Enum):
 
         :raise ValueError: Provided value is not a member neither a value of this Enum.
         """
+        if isinstance(value, cls):
+            return value
+        try:
+            return cls._value2member_map_[value]  # type: ignore
+        except (KeyError, TypeError):  # not a value of a member or unhashable - use Enum's complete lookup
+            pass
         try:
             return cls(value)
         except ValueError: